@@ -1,33 +1,57 @@
 import asyncio
+from collections import OrderedDict
 from io import BytesIO
 from typing import Optional, Union
 
 import aiohttp
 import discord
 from discord.ext import commands
-from PIL import Image, ImageStat, UnidentifiedImageError
+from PIL import Image, UnidentifiedImageError
 
 
 class Avatar(commands.Cog):
+    COLOR_CACHE_SIZE = 512  # 最多快取幾個頭貼的平均顏色
+
     def __init__(self, bot):
         self.bot = bot
+        self._session: Optional[aiohttp.ClientSession] = None
+        # 以頭貼 hash 為 key 的平均顏色 LRU 快取（使用者換頭貼後 hash 會改變）
+        self._color_cache: OrderedDict[str, tuple[int, int, int]] = OrderedDict()
+
+    async def cog_load(self):
+        """建立共用的 HTTP session，讓頭貼下載可以重用連線"""
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=10),
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=75),
+        )
+
+    async def cog_unload(self):
+        """關閉共用的 HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def _get_average_color(self, avatar_url: str) -> tuple[int, int, int]:
         """非同步獲取圖片並計算平均顏色"""
-        timeout = aiohttp.ClientTimeout(total=10)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(avatar_url) as response:
-                response.raise_for_status()
-                image_data = await response.read()
+        async with self._session.get(avatar_url) as response:
+            response.raise_for_status()
+            image_data = await response.read()
 
         return await asyncio.to_thread(self._calculate_average_color, image_data)
 
     @staticmethod
     def _calculate_average_color(image_data: bytes) -> tuple[int, int, int]:
+        # 每個中間影像都會立即關閉，併發查詢時不會讓解碼緩衝區等到 GC 才釋放
         with Image.open(BytesIO(image_data)) as source:
-            image = source.convert("RGB")
-            mean = ImageStat.Stat(image).mean
-        return tuple(round(channel) for channel in mean)
+            # RGB/RGBA（WebP 頭貼的常見模式）可以直接縮放，不需要先複製一份轉換
+            image = source if source.mode in ("RGB", "RGBA") else source.convert("RGB")
+            try:
+                # BOX 縮成 1x1 等同於對所有像素取平均，整個運算都在 Pillow 的 C 程式碼內完成
+                # RGBA 縮放時 Pillow 會依透明度加權，透明像素不會把顏色拉暗
+                with image.resize((1, 1), Image.Resampling.BOX) as pixel:
+                    return pixel.getpixel((0, 0))[:3]
+            finally:
+                image.close()
 
     @discord.app_commands.command(name="查看成員頭貼", description="顯示目標成員的頭貼，可擇一使用選擇用戶或輸入用戶id")
     @discord.app_commands.describe(
@@ -47,10 +71,7 @@ class Avatar(commands.Cog):
 
         # 不能同時指定
         if member and user_id:
-            await interaction.response.send_message(
-                embed=discord.Embed(title="錯誤", description="請勿同時輸入成員和用戶id", color=0xff0000), 
-                ephemeral=True
-            )
+            await interaction.response.send_message("❌ 請勿同時輸入成員和用戶id", ephemeral=True)
             return
 
         # 透過 ID 查找用戶
@@ -63,31 +84,19 @@ class Avatar(commands.Cog):
                 member = user
             except ValueError:
                 await interaction.response.send_message(
-                    embed=discord.Embed(
-                        title="錯誤",
-                        description="請輸入正確的用戶id\n可透過打開discord設定內的開發者模式，使用滑鼠右鍵選單來對用戶複製id",
-                        color=0xff0000
-                    ),
-                    ephemeral=True
+                    "❌ 請輸入正確的用戶id\n可透過打開discord設定內的開發者模式，使用滑鼠右鍵選單來對用戶複製id",
+                    ephemeral=True,
                 )
                 return
             except discord.NotFound:
                 await interaction.response.send_message(
-                    embed=discord.Embed(
-                        title="錯誤",
-                        description="無法找到指定的用戶",
-                        color=discord.Color.red(),
-                    ),
+                    "❌ 無法找到指定的用戶",
                     ephemeral=True,
                 )
                 return
             except discord.HTTPException:
                 await interaction.response.send_message(
-                    embed=discord.Embed(
-                        title="錯誤",
-                        description="Discord 暫時無法查詢該用戶，請稍後再試。",
-                        color=discord.Color.red(),
-                    ),
+                    "❌ Discord 暫時無法查詢該用戶，請稍後再試。",
                     ephemeral=True,
                 )
                 return
@@ -97,15 +106,22 @@ class Avatar(commands.Cog):
 
         avatar = member.display_avatar
         avatar_url = avatar.url
-        color_source_url = avatar.replace(size=128, static_format="png").url
-        try:
-            avg_color = await self._get_average_color(color_source_url)
-        except (aiohttp.ClientError, asyncio.TimeoutError, UnidentifiedImageError, OSError):
-            await interaction.followup.send(
-                "無法讀取頭貼圖片，請稍後再試。",
-                ephemeral=True,
-            )
-            return
+        avg_color = self._color_cache.get(avatar.key)
+        if avg_color is None:
+            color_source_url = avatar.replace(size=64, static_format="webp").url
+            try:
+                avg_color = await self._get_average_color(color_source_url)
+            except (aiohttp.ClientError, asyncio.TimeoutError, UnidentifiedImageError, OSError):
+                await interaction.followup.send(
+                    "無法讀取頭貼圖片，請稍後再試。",
+                    ephemeral=True,
+                )
+                return
+            self._color_cache[avatar.key] = avg_color
+            if len(self._color_cache) > self.COLOR_CACHE_SIZE:
+                self._color_cache.popitem(last=False)
+        else:
+            self._color_cache.move_to_end(avatar.key)
         
         embed = discord.Embed(
             title=f"{member.name} 的頭貼", 
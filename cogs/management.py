@@ -11,10 +11,22 @@ from loguru import logger
 
 ExtensionAction = Literal["load", "unload", "reload"]
 
+# (權限名稱, 位元) 對照表，順序與 Permissions 迭代一致；狀態指令直接用位元判斷
+PERMISSION_FLAGS: tuple[tuple[str, int], ...] = tuple(
+    (name, discord.Permissions.VALID_FLAGS[name])
+    for name, _ in discord.Permissions.none()
+)
+
 
 class ManagementCommand(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # 模組清單快取：自動完成每次按鍵都會查詢，只在執行模組操作後重新掃描
+        self._extension_names: tuple[str, ...] = ()
+        self._refresh_extension_names()
+
+    def _refresh_extension_names(self) -> None:
+        self._extension_names = self.bot.discover_extension_names()
 
     @staticmethod
     def _is_admin(interaction: discord.Interaction) -> bool:
@@ -59,7 +71,7 @@ class ManagementCommand(commands.Cog):
         current_folded = current.casefold()
         names = (
             name
-            for name in self.bot.discover_extension_names()
+            for name in self._extension_names
             if current_folded in name.casefold()
             and (not exclude_management or name != self.bot.management_name)
         )
@@ -74,6 +86,8 @@ class ManagementCommand(commands.Cog):
         if not await self._require_admin(interaction):
             return
 
+        # 新增或移除的 Cog 檔案在下一次模組操作後就會出現在自動完成中
+        self._refresh_extension_names()
         full_path = self.bot.extension_path(extension)
         if full_path is None:
             await interaction.response.send_message(
@@ -221,10 +235,11 @@ class ManagementCommand(commands.Cog):
         channel = interaction.channel
         bot_member = guild.me if guild is not None else None
         if channel is not None and bot_member is not None:
+            granted = channel.permissions_for(bot_member).value
             permissions = [
                 f"- {name}"
-                for name, enabled in channel.permissions_for(bot_member)
-                if enabled
+                for name, flag in PERMISSION_FLAGS
+                if granted & flag
             ]
             permission_value = "\n".join(permissions[:10]) or "（無）"
         else:
@@ -237,10 +252,11 @@ class ManagementCommand(commands.Cog):
         )
 
         active_extensions = set(self.bot.extensions)
+        cogs_package = self.bot.cogs_package
         module_status = "\n".join(
             f"- {name}: "
-            f"{'已載入' if self.bot.extension_path(name) in active_extensions else '未載入'}"
-            for name in self.bot.discover_extension_names()
+            f"{'已載入' if f'{cogs_package}.{name}' in active_extensions else '未載入'}"
+            for name in self._extension_names
         )
         embed.add_field(
             name="模組狀態",
@@ -368,6 +384,8 @@ class RestartConfirmView(discord.ui.View):
 
 def restart_program() -> None:
     """Replace the current process with a fresh Python process."""
+    # execl 不會執行 atexit，先等待背景 logging 佇列寫完
+    logger.complete()
     python = sys.executable
     os.execl(python, python, *sys.argv)
 
@@ -2,6 +2,30 @@ import discord
 from discord.ext import commands
 import random
 
+# 炸彈在地圖中以 9 表示，剛好接在 0-8 的數字後面，可直接當作 EMOJI_MAP 的索引
+BOMB = 9
+EMOJI_MAP = [
+    '||:zero:||', '||:one:||', '||:two:||', '||:three:||', '||:four:||',
+    '||:five:||', '||:six:||', '||:seven:||', '||:eight:||', '||:bomb:||'
+]
+
+# 預先算好每種地圖大小（1-9 x 1-9）中每個格子的鄰居索引（一維，index = y * columns + x），
+# 指令執行時不用再做邊界檢查
+NEIGHBORS = {
+    (rows, columns): [
+        [
+            ny * columns + nx
+            for ny in range(y - 1, y + 2)
+            for nx in range(x - 1, x + 2)
+            if (nx, ny) != (x, y) and 0 <= nx < columns and 0 <= ny < rows
+        ]
+        for y in range(rows)
+        for x in range(columns)
+    ]
+    for rows in range(1, 10)
+    for columns in range(1, 10)
+}
+
 class Minesweeper(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -19,45 +43,33 @@ class Minesweeper(commands.Cog):
             await interaction.response.send_message("列與行數需在 1-9 之間！", ephemeral=True)
             return
 
-        # 驗證炸彈數量是否合理
+        # 驗證炸彈數量是否合理（random.sample 遇到負數會直接拋出 ValueError）
+        if bombs < 0:
+            await interaction.response.send_message("炸彈數量不能是負數！", ephemeral=True)
+            return
         if bombs >= columns * rows:
             await interaction.response.send_message("炸彈數量不能超過網格總數！", ephemeral=True)
             return
 
-        # 初始化地圖
-        grid = [[0 for _ in range(columns)] for _ in range(rows)]
-
-        # 隨機放置炸彈
-        for _ in range(bombs):
-            while True:
-                x, y = random.randint(0, columns - 1), random.randint(0, rows - 1)
-                if grid[y][x] != 'B':  # 防止重複放置炸彈，然後出bug(?
-                    grid[y][x] = 'B'
-                    break
+        # 初始化地圖（一維 bytearray，每格存 0-8 或 BOMB）
+        grid = bytearray(rows * columns)
 
-        # 計算每個格子周圍的炸彈數
-        directions = [
-            (0, 1), (0, -1), (1, 0), (-1, 0),  # 上、下、左、右
-            (1, 1), (-1, -1), (1, -1), (-1, 1)  # 四個對角線
-        ]
-        for y in range(rows):
-            for x in range(columns):
-                if grid[y][x] == 'B':  # 如果是炸彈，則跳過
-                    continue
-                # 計算周圍炸彈數量
-                bomb_count = sum(
-                    1 for dx, dy in directions
-                    if 0 <= x + dx < columns and 0 <= y + dy < rows and grid[y + dy][x + dx] == 'B'
-                )
-                grid[y][x] = bomb_count
+        # 隨機放置炸彈（random.sample 保證位置不重複，不需要碰撞重抽），
+        # 放置的同時往周圍八格各加 1（等同 3x3 卷積），只需走訪炸彈而非整張地圖。
+        # 之後若有炸彈落在已計數的格子上會直接覆蓋成 BOMB，所以順序不影響結果
+        neighbors = NEIGHBORS[(rows, columns)]
+        for position in random.sample(range(rows * columns), bombs):
+            grid[position] = BOMB
+            for neighbor in neighbors[position]:
+                if grid[neighbor] != BOMB:
+                    grid[neighbor] += 1
 
-        # 建構地圖字串
-        emoji_map = {
-            0: '||:zero:||', 1: '||:one:||', 2: '||:two:||', 3: '||:three:||',
-            4: '||:four:||', 5: '||:five:||', 6: '||:six:||', 7: '||:seven:||',
-            8: '||:eight:||', 'B': '||:bomb:||'
-        }
-        final_map = '\n'.join(''.join(emoji_map[cell] for cell in row) for row in grid)
+        # 建構地圖字串（每列用 map 直接以格子值查 EMOJI_MAP，避免逐格的 Python 迴圈）
+        to_emoji = EMOJI_MAP.__getitem__
+        final_map = '\n'.join(
+            ''.join(map(to_emoji, grid[start:start + columns]))
+            for start in range(0, len(grid), columns)
+        )
 
         # 計算炸彈比例
         percentage = round((bombs / (columns * rows)) * 100, 2)
@@ -38,10 +38,14 @@ from module.music_player import (
     CACHE_DIR,
     PLAYLIST_PER_PAGE,
     RECONNECT_MAX_ATTEMPTS,
-    RECONNECT_INTERVAL,
+    RECONNECT_BACKOFF_BASE,
+    RECONNECT_BACKOFF_MAX,
     YTDLP_UPDATE_INTERVAL,
     MANUAL_OPERATION_DEBOUNCE,
+    UI_REFRESH_DEBOUNCE,
     EMBED_UPDATE_INTERVAL,
+    EMBED_UPDATE_TICK,
+    PROGRESS_BAR_LENGTH,
     VOICE_CONNECT_MAX_RETRIES,
     VOICE_CONNECT_RETRY_DELAY,
 )
@@ -50,10 +54,14 @@ from module.music_player import (
 import asyncio
 import json
 import os
+import random
 import sys
 import time
 from loguru import logger
 
+# 可預期的錯誤（歌曲不可用、佇列錯誤、Discord API 失敗、逾時），只記錄訊息不輸出 traceback
+EXPECTED_ERRORS = (MusicError, discord.HTTPException, asyncio.TimeoutError)
+
 class MusicPlayerCog(commands.Cog):
     """Discord 音樂播放器 Cog"""
     
@@ -70,6 +78,7 @@ class MusicPlayerCog(commands.Cog):
         self.player_view: MusicPlayerView | None = None
         self.player_message: discord.Message | None = None
         self.playlist_message: discord.Message | None = None
+        self.pagination_view: PaginationView | None = None
         
         # 分頁設定
         self.playlist_per_page = PLAYLIST_PER_PAGE
@@ -80,15 +89,23 @@ class MusicPlayerCog(commands.Cog):
         self.manual_disconnect = False
         self.reconnect_attempts = 0
         self.max_reconnect_attempts = RECONNECT_MAX_ATTEMPTS
-        self.last_yt_dlp_check: float | None = None
 
         # 播放鎖（防止競爭條件）
         self._play_lock = asyncio.Lock()
-        self._yt_dlp_update_lock = asyncio.Lock()
 
         # 追蹤 wrapper 背景任務，避免 cleanup 時遺漏未完成 task
         self._background_tasks: set[asyncio.Task] = set()
 
+        # 播放器訊息編輯合併（同時間的多次更新只送出最新的嵌入）
+        self._pending_player_embed: discord.Embed | None = None
+        self._player_edit_task: asyncio.Task | None = None
+        # 最後一次成功送出的播放器訊息狀態，內容相同時略過編輯
+        self._last_player_state: tuple | None = None
+        # 定期更新最後一次處理的進度 (song_id, 進度格數)，格數不變時不編輯訊息
+        self._last_progress_key: tuple | None = None
+        # 防抖中的播放器 UI 刷新任務
+        self._pending_refresh: asyncio.Task | None = None
+
         # 背景任務
         self.update_embed_task = self.update_embed
     
@@ -98,6 +115,11 @@ class MusicPlayerCog(commands.Cog):
         os.makedirs(CACHE_DIR, exist_ok=True)
         logger.debug(f"確認 {CACHE_DIR} 目錄存在")
         
+        # yt-dlp 更新檢查改由背景定期任務執行（首次立即執行，與 FFmpeg 初始化重疊），
+        # 不再佔用使用者指令的回應時間
+        if not self.ytdlp_update_loop.is_running():
+            self.ytdlp_update_loop.start()
+        
         # 初始化 FFmpeg（優先使用系統 PATH，找不到才下載）
         self.ffmpeg_path = await get_ffmpeg_path()
         
@@ -122,6 +144,7 @@ class MusicPlayerCog(commands.Cog):
     
     async def cog_unload(self):
         """Cog 卸載時清理資源"""
+        self.ytdlp_update_loop.cancel()
         await self._cleanup_resources()
         logger.info("[MusicPlayerCog] 已卸載，資源已清理")
     
@@ -154,8 +177,9 @@ class MusicPlayerCog(commands.Cog):
                 return
 
             # 檢查是否有手動操作（避免重複觸發）
-            if self.player.state.last_manual_operation_time:
-                time_since_manual = time.time() - self.player.state.last_manual_operation_time
+            last_manual_operation_time = self.player.state.last_manual_operation_time
+            if last_manual_operation_time:
+                time_since_manual = time.monotonic() - last_manual_operation_time
                 if time_since_manual < MANUAL_OPERATION_DEBOUNCE:
                     logger.debug(f"檢測到最近的手動操作 ({time_since_manual:.2f}s 前)，忽略自動切歌")
                     return
@@ -261,8 +285,19 @@ class MusicPlayerCog(commands.Cog):
                 embed = self.embed_builder.downloading_embed(song)
                 await self._update_player_message(embed)
                 
+                # 跳轉到預載範圍內的歌曲時，沿用已在下載中的預載而不是重複下載
+                if cache.is_downloading(song.id):
+                    await cache.wait_for_preload(song.id)
+                # 預載也可能在更新訊息期間剛好完成
+                file_path = cache.get(song.id)
+            
+            if not file_path:
+                # 還在排隊等名額或等待逾時的預載先取消並等它結束，
+                # 使用者點的歌不排在其他預載後面，也不能讓兩個下載同時寫入同一首歌的檔案
+                await cache.cancel_preload(song.id)
+                
                 # 下載歌曲
-                info, file_path = await self.downloader.download(song.url)
+                _, file_path = await self.downloader.download(song.url, song.id)
                 
                 if not file_path:
                     raise SongUnavailableError(song.title)
@@ -281,6 +316,7 @@ class MusicPlayerCog(commands.Cog):
             
             # 更新 UI
             await self._refresh_player_ui()
+            self._wake_update_embed()
             return True
             
         except SongUnavailableError:
@@ -333,19 +369,98 @@ class MusicPlayerCog(commands.Cog):
         
         # 更新按鈕狀態
         if self.player_view:
+            queue = self.player.queue
             self.player_view.update_play_pause(self.player.is_playing)
-            self.player_view.update_loop(self.player.queue.loop)
+            self.player_view.update_loop(queue.loop)
             self.player_view.update_navigation(
-                has_previous=self.player.queue.current_index > 0,
-                has_next=self.player.queue.current_index < len(self.player.queue) - 1,
+                has_previous=queue.has_previous(),
+                has_next=queue.has_next(),
             )
         
         await self._update_player_message(embed)
     
+    def _schedule_refresh(self):
+        """延遲刷新播放器 UI；防抖時間內再次呼叫會重新計時，最後只刷新一次"""
+        if self._pending_refresh and not self._pending_refresh.done():
+            self._pending_refresh.cancel()
+        
+        task = asyncio.create_task(
+            self._debounced_refresh(),
+            name="music_player_refresh"
+        )
+        self._pending_refresh = task
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def _debounced_refresh(self):
+        """等待防抖時間後刷新播放器 UI"""
+        await asyncio.sleep(UI_REFRESH_DEBOUNCE)
+        try:
+            await self._refresh_player_ui()
+        except Exception as e:
+            logger.error(f"刷新播放器 UI 時發生錯誤: {e}")
+    
     async def _update_player_message(self, embed: discord.Embed):
-        """更新播放器訊息"""
-        if self.player_message:
-            await self._edit_player_message(embed=embed, view=self.player_view)
+        """
+        更新播放器訊息
+
+        編輯進行中時再送來的更新只會保留最新一筆，等目前的編輯完成後再一次送出，
+        避免按鈕、播放切換與定期更新同時搶著編輯同一則訊息。
+        """
+        if not self.player_message:
+            return
+
+        self._pending_player_embed = embed
+        task = self._player_edit_task
+        if task is None or task.done():
+            task = asyncio.create_task(
+                self._flush_player_message(),
+                name="music_player_message_edit"
+            )
+            self._player_edit_task = task
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+        # 等待本次狀態送出；使用 wait 而非直接 await，避免共用的編輯任務被呼叫者取消
+        await asyncio.wait((task,))
+
+    async def _flush_player_message(self):
+        """依序送出最新一筆待更新的播放器嵌入，直到沒有新的更新"""
+        while self._pending_player_embed is not None:
+            embed = self._pending_player_embed
+            self._pending_player_embed = None
+
+            state = self._player_message_state(embed)
+            last_state = self._last_player_state
+            if state is not None and state == last_state:
+                logger.debug("播放器訊息內容未變更，略過編輯")
+                continue
+
+            # 按鈕狀態沒變時只送出嵌入，不重送整個 view 的元件
+            if state is not None and last_state is not None and state[:3] == last_state[:3]:
+                edited = await self._edit_player_message(embed=embed)
+            else:
+                edited = await self._edit_player_message(embed=embed, view=self.player_view)
+
+            if edited:
+                self._last_player_state = state
+
+    def _player_message_state(self, embed: discord.Embed) -> tuple | None:
+        """
+        取得播放器訊息目前要呈現的狀態，用於比對是否需要編輯
+
+        格式為 (訊息 ID, view, 按鈕狀態, 嵌入內容)，前三項相同代表按鈕不需重送
+        """
+        if not self.player_message:
+            return None
+
+        view = self.player_view
+        buttons = tuple(
+            (item.custom_id, item.disabled, item.style, str(item.emoji))
+            for item in view.children
+            if isinstance(item, discord.ui.Button)
+        ) if view else ()
+        return (self.player_message.id, id(view), buttons, embed.to_dict())
 
     async def _bind_persistent_message(
         self,
@@ -372,15 +487,30 @@ class MusicPlayerCog(commands.Cog):
         **kwargs,
     ) -> discord.Message | None:
         """安全編輯訊息，必要時在 webhook token 過期後重新綁定重試。"""
+        message, _ = await self._try_edit_message(message, **kwargs)
+        return message
+
+    async def _try_edit_message(
+        self,
+        message: discord.Message | None,
+        **kwargs,
+    ) -> tuple[discord.Message | None, bool]:
+        """
+        編輯訊息並回報結果
+
+        Returns:
+            (之後應沿用的訊息引用, 這次編輯是否成功)；
+            一般 HTTP 錯誤時仍回傳原訊息引用，但編輯視為失敗
+        """
         if message is None:
-            return None
+            return None, False
 
         try:
             await message.edit(**kwargs)
-            return message
+            return message, True
         except discord.NotFound:
             logger.warning("播放器訊息已被刪除")
-            return None
+            return None, False
         except discord.HTTPException as error:
             if getattr(error, "code", None) == 50027:
                 logger.warning("播放器訊息 webhook token 已失效，嘗試重新綁定一般訊息引用")
@@ -388,22 +518,28 @@ class MusicPlayerCog(commands.Cog):
                 if rebound_message is not None and rebound_message is not message:
                     try:
                         await rebound_message.edit(**kwargs)
-                        return rebound_message
+                        return rebound_message, True
                     except discord.NotFound:
                         logger.warning("重新綁定後的播放器訊息已不存在")
-                        return None
+                        return None, False
                     except discord.HTTPException as rebound_error:
                         logger.error(f"重新綁定後仍無法更新播放器訊息: {rebound_error}")
-                        return rebound_message
+                        return rebound_message, False
 
             logger.error(f"更新播放器訊息失敗: {error}")
-            return message
+            return message, False
 
     async def _edit_player_message(self, **kwargs) -> bool:
-        """更新目前追蹤中的播放器訊息，並維持最新的訊息引用。"""
-        updated_message = await self._edit_message_safely(self.player_message, **kwargs)
+        """
+        更新目前追蹤中的播放器訊息，並維持最新的訊息引用。
+
+        Returns:
+            這次編輯是否成功（失敗時訊息引用仍可能保留，下次更新會重送完整內容）
+        """
+        self._last_player_state = None
+        updated_message, edited = await self._try_edit_message(self.player_message, **kwargs)
         self.player_message = updated_message
-        return updated_message is not None
+        return edited
     
     async def _show_empty_queue(self):
         """顯示佇列為空的狀態"""
@@ -460,6 +596,7 @@ class MusicPlayerCog(commands.Cog):
         
         if self.player.is_paused:
             await self.player.resume()
+            self._wake_update_embed()
         elif self.player.is_playing:
             await self.player.pause()
         else:
@@ -642,13 +779,11 @@ class MusicPlayerCog(commands.Cog):
                 "播放器已經啟動，請使用 `/音樂-新增` 指令。"
             )
             return
-
-        await self._ensure_ytdlp_current()
         
         try:
-            # 取得訊息，並立即重新綁定成一般 channel message
-            original_message = await interaction.original_response()
-            self.player_message = await self._bind_persistent_message(original_message)
+            # 直接沿用 interaction 訊息；webhook token 過期（15 分鐘）時
+            # _edit_message_safely 會再重新綁定成一般 channel message
+            self.player_message = await interaction.original_response()
             
             # 連接語音頻道（帶重試）
             channel = interaction.user.voice.channel
@@ -686,37 +821,23 @@ class MusicPlayerCog(commands.Cog):
     async def _handle_single_song_start(self, interaction: discord.Interaction, url: str):
         """處理單曲播放啟動"""
         try:
-            # 取得歌曲資訊
-            info = await self.downloader.extract_info(url)
+            # 下載（download 會一併回傳歌曲資訊，不需再另外 extract_info）
+            info, file_path = await self.downloader.download(url)
             if not info:
                 embed = self.embed_builder.error_embed("無法解析音樂資訊")
                 await self._edit_player_message(content=None, embed=embed, view=None)
                 return
             
-            # 建立 Song 物件（確保 duration 為 int）
-            duration = info.get("duration") or 0
-            try:
-                duration = int(float(duration)) if duration else 0
-            except (ValueError, TypeError, OverflowError):
-                duration = 0
-            
-            song = Song(
-                id=info.get("id") or "",
-                title=info.get("title") or "未知標題",
-                url=url,
-                duration=duration,
-                thumbnail=info.get("thumbnail") or "",
-                uploader=info.get("uploader") or "未知上傳者",
-                uploader_url=info.get("uploader_url") or "",
-            )
-            
-            # 下載
-            _, file_path = await self.downloader.download(url)
-            if not file_path:
-                embed = self.embed_builder.error_embed("下載音樂失敗")
+            if info.get("success") is False or not file_path:
+                embed = self.embed_builder.error_embed(
+                    info.get("display_message") or "下載音樂失敗"
+                )
                 await self._edit_player_message(content=None, embed=embed, view=None)
                 return
             
+            # 建立 Song 物件
+            song = Song.from_entry(info, url=url)
+            
             # 加入佇列和快取
             await self.player.queue.add(song)
             self.player.cache.put(song.id, str(file_path))
@@ -739,9 +860,13 @@ class MusicPlayerCog(commands.Cog):
             await self._edit_player_message(content=None, embed=embed, view=self.player_view)
             
             # 啟動定期更新任務
-            if not self.update_embed_task.is_running():
-                self.update_embed_task.start()
+            self._wake_update_embed()
                 
+        except EXPECTED_ERRORS as e:
+            # 預期內的錯誤只記錄訊息，不格式化整段 traceback
+            logger.warning(f"啟動單曲播放失敗: {e}")
+            embed = self.embed_builder.error_embed(f"錯誤: {e}")
+            await self._edit_player_message(content=None, embed=embed, view=None)
         except Exception as e:
             logger.exception(f"啟動單曲播放時發生錯誤: {e}")
             embed = self.embed_builder.error_embed(f"錯誤: {e}")
@@ -757,32 +882,19 @@ class MusicPlayerCog(commands.Cog):
                 await self._edit_player_message(content=None, embed=embed, view=None)
                 return
             
-            # 建立 Song 物件並加入佇列
-            songs = []
-            for entry in entries:
-                # 確保 duration 為 int
-                duration = entry.get("duration") or 0
-                try:
-                    duration = int(float(duration)) if duration else 0
-                except (ValueError, TypeError, OverflowError):
-                    duration = 0
-                
-                song = Song(
-                    id=entry.get("id") or "",
-                    title=entry.get("title") or "未知標題",
-                    url=entry.get("url") or "",
-                    duration=duration,
-                    thumbnail=entry.get("thumbnail") or "",
-                    uploader=entry.get("uploader") or "未知上傳者",
-                    uploader_url=entry.get("uploader_url") or "",
-                )
-                songs.append(song)
-                await self.player.queue.add(song)
+            # 建立 Song 物件並一次性加入佇列
+            songs = [Song.from_entry(entry) for entry in entries]
+            await self.player.queue.add_many(songs)
+            
+            # 先啟動背景預載（第 2 首起的滑動視窗，數量受 window_ahead 限制），
+            # 讓後續歌曲與第一首同時下載，而不是等第一首開始播放後才預載
+            self._schedule_preload_upcoming()
             
             # 下載第一首
             first_song = songs[0]
-            _, file_path = await self.downloader.download(first_song.url)
+            _, file_path = await self.downloader.download(first_song.url, first_song.id)
             if not file_path:
+                await self.player.cache.cancel_all_preloads_and_wait()
                 embed = self.embed_builder.error_embed("下載第一首歌曲失敗")
                 await self._edit_player_message(content=None, embed=embed, view=None)
                 return
@@ -806,12 +918,12 @@ class MusicPlayerCog(commands.Cog):
             await self._edit_player_message(content=None, embed=embed, view=self.player_view)
             
             # 啟動定期更新任務
-            if not self.update_embed_task.is_running():
-                self.update_embed_task.start()
-            
-            # 背景預載
-            self._schedule_preload_upcoming()
+            self._wake_update_embed()
             
+        except EXPECTED_ERRORS as e:
+            logger.warning(f"啟動播放清單失敗: {e}")
+            embed = self.embed_builder.error_embed(f"錯誤: {e}")
+            await self._edit_player_message(content=None, embed=embed, view=None)
         except Exception as e:
             logger.exception(f"啟動播放清單時發生錯誤: {e}")
             embed = self.embed_builder.error_embed(f"錯誤: {e}")
@@ -832,8 +944,6 @@ class MusicPlayerCog(commands.Cog):
                 ephemeral=True
             )
             return
-
-        await self._ensure_ytdlp_current()
         
         try:
             is_playlist = self.downloader.is_playlist(url)
@@ -857,15 +967,7 @@ class MusicPlayerCog(commands.Cog):
                 return
             
             # 建立 Song 物件
-            song = Song(
-                id=info.get("id") or "",
-                title=info.get("title") or "未知標題",
-                url=url,
-                duration=info.get("duration") or 0,
-                thumbnail=info.get("thumbnail") or "",
-                uploader=info.get("uploader") or "未知上傳者",
-                uploader_url=info.get("uploader_url") or "",
-            )
+            song = Song.from_entry(info, url=url)
             
             # 加入佇列
             await self.player.queue.add(song)
@@ -884,6 +986,9 @@ class MusicPlayerCog(commands.Cog):
             # 更新按鈕
             await self._refresh_player_ui()
             
+        except EXPECTED_ERRORS as e:
+            logger.warning(f"新增單曲失敗: {e}")
+            await interaction.followup.send("無法新增音樂，請稍後再試。", ephemeral=True)
         except Exception as e:
             logger.exception(f"新增單曲時發生錯誤: {e}")
             await interaction.followup.send("無法新增音樂，請稍後再試。", ephemeral=True)
@@ -899,44 +1004,36 @@ class MusicPlayerCog(commands.Cog):
                 await interaction.followup.send("無法解析播放清單或播放清單為空", ephemeral=True)
                 return
             
-            # 加入佇列
-            added_count = 0
+            # 加入佇列（先建立全部 Song，再一次性加入）
             was_empty = len(self.player.queue) == 0 or not self.player.is_playing
-            first_new_song = None
-            
-            for entry in entries:
-                song = Song(
-                    id=entry.get("id") or "",
-                    title=entry.get("title") or "未知標題",
-                    url=entry.get("url") or "",
-                    duration=entry.get("duration") or 0,
-                    thumbnail=entry.get("thumbnail") or "",
-                    uploader=entry.get("uploader") or "未知上傳者",
-                    uploader_url=entry.get("uploader_url") or "",
-                )
-                await self.player.queue.add(song)
-                added_count += 1
-                
-                if first_new_song is None:
-                    first_new_song = song
+            
+            songs = [Song.from_entry(entry) for entry in entries]
+            start_index = await self.player.queue.add_many(songs)
+            added_count = len(songs)
+            first_new_song = songs[0] if songs else None
+            start_playing = was_empty and first_new_song is not None
+            
+            # 如果之前沒有播放，先用 jump_to 跳到第一首新歌的位置
+            if start_playing:
+                self.player.queue.jump_to(start_index)
+            
+            # 歌曲一入列就開始背景預載，讓下載與回覆訊息、第一首歌的下載重疊
+            self._schedule_preload_upcoming()
             
             # 顯示結果
             embed = self.embed_builder.added_songs_embed(added_count)
             await interaction.followup.send(embed=embed)
             
-            # 如果之前沒有播放，開始播放第一首新歌
-            if was_empty and first_new_song:
-                # 使用 jump_to 跳到第一首新歌的位置
-                target_index = len(self.player.queue) - added_count
-                self.player.queue.jump_to(target_index)
+            # 開始播放第一首新歌
+            if start_playing:
                 await self._play_song(first_new_song)
             
             # 更新按鈕
             await self._refresh_player_ui()
             
-            # 背景預載
-            self._schedule_preload_upcoming()
-            
+        except EXPECTED_ERRORS as e:
+            logger.warning(f"新增播放清單失敗: {e}")
+            await interaction.followup.send("無法新增播放清單，請稍後再試。", ephemeral=True)
         except Exception as e:
             logger.exception(f"新增播放清單時發生錯誤: {e}")
             await interaction.followup.send("無法新增播放清單，請稍後再試。", ephemeral=True)
@@ -963,36 +1060,29 @@ class MusicPlayerCog(commands.Cog):
                     pass
                 self.playlist_message = None
             
-            # 取得分頁資料
-            songs = list(self.player.queue)
-            total_songs = len(songs)
-            total_pages = max(1, (total_songs + self.playlist_per_page - 1) // self.playlist_per_page)
-            
-            self.current_playlist_page = 1
+            # 取得分頁資料（只切出該頁的歌曲，不複製整個佇列）
+            page_data = self.player.queue.get_page(1, self.playlist_per_page)
+            self.current_playlist_page = page_data["current_page"]
             
             # 建立嵌入
-            embed = self.embed_builder.playlist_embed(
-                songs=songs,
-                current_index=self.player.queue.current_index,
-                page=1,
-                per_page=self.playlist_per_page,
-            )
+            embed = self.embed_builder.playlist_from_page(page_data)
             
-            # 建立翻頁按鈕
-            pagination_view = PaginationView(
+            # 建立翻頁按鈕（翻頁時原地更新，不再重新建立）
+            if self.pagination_view:
+                self.pagination_view.stop()
+            self.pagination_view = PaginationView(
                 button_callback=self._pagination_callback,
                 timeout_callback=self._playlist_timeout_callback,
-                current_page=1,
-                total_pages=total_pages,
+                current_page=page_data["current_page"],
+                total_pages=page_data["total_pages"],
             )
             
             # 發送訊息
             self.playlist_message = await interaction.followup.send(
                 embed=embed,
-                view=pagination_view,
+                view=self.pagination_view,
                 wait=True,
             )
-            self.playlist_message = await self._bind_persistent_message(self.playlist_message)
             
         except Exception as e:
             logger.exception(f"查看播放清單時發生錯誤: {e}")
@@ -1000,40 +1090,33 @@ class MusicPlayerCog(commands.Cog):
     
     async def _pagination_callback(self, interaction: discord.Interaction, action: str):
         """處理翻頁按鈕"""
-        if not self.player or not self.playlist_message:
+        if not self.player or not self.playlist_message or not self.pagination_view:
             return
         
         try:
-            songs = list(self.player.queue)
-            total_songs = len(songs)
-            total_pages = max(1, (total_songs + self.playlist_per_page - 1) // self.playlist_per_page)
-            
-            # 計算新頁碼
+            # 計算新頁碼（get_page 會將頁碼限制在有效範圍內）
             if action == PaginationView.ACTION_PREVIOUS_PAGE:
-                self.current_playlist_page = max(1, self.current_playlist_page - 1)
+                requested_page = self.current_playlist_page - 1
             else:
-                self.current_playlist_page = min(total_pages, self.current_playlist_page + 1)
+                requested_page = self.current_playlist_page + 1
+            
+            # 取得分頁資料（只切出該頁的歌曲，不複製整個佇列）
+            page_data = self.player.queue.get_page(requested_page, self.playlist_per_page)
+            self.current_playlist_page = page_data["current_page"]
             
             # 建立嵌入
-            embed = self.embed_builder.playlist_embed(
-                songs=songs,
-                current_index=self.player.queue.current_index,
-                page=self.current_playlist_page,
-                per_page=self.playlist_per_page,
-            )
+            embed = self.embed_builder.playlist_from_page(page_data)
             
-            # 更新按鈕
-            pagination_view = PaginationView(
-                button_callback=self._pagination_callback,
-                timeout_callback=self._playlist_timeout_callback,
-                current_page=self.current_playlist_page,
-                total_pages=total_pages,
+            # 原地更新按鈕狀態
+            self.pagination_view.update_page(
+                page_data["current_page"],
+                page_data["total_pages"],
             )
             
             self.playlist_message = await self._edit_message_safely(
                 self.playlist_message,
                 embed=embed,
-                view=pagination_view,
+                view=self.pagination_view,
             )
             
         except Exception as e:
@@ -1041,6 +1124,7 @@ class MusicPlayerCog(commands.Cog):
     
     async def _playlist_timeout_callback(self):
         """播放清單視圖超時"""
+        self.pagination_view = None
         if self.playlist_message:
             try:
                 self.playlist_message = await self._edit_message_safely(
@@ -1069,7 +1153,7 @@ class MusicPlayerCog(commands.Cog):
             cleared_count = await self.player.queue.clear()
             
             # 清空快取
-            self.player.cache.clear()
+            await self.player.cache.clear()
             
             # 更新 UI
             if self.player_message:
@@ -1115,13 +1199,12 @@ class MusicPlayerCog(commands.Cog):
                 embed = self.embed_builder.error_embed("播放清單中無音樂")
                 embed.description = "請透過 `/音樂-新增` 來新增音樂"
             
-            # 發送新的播放器訊息
+            # 發送新的播放器訊息（webhook token 過期時才由 _edit_message_safely 重新綁定）
             self.player_message = await interaction.followup.send(
                 embed=embed,
                 view=self.player_view,
                 wait=True,
             )
-            self.player_message = await self._bind_persistent_message(self.player_message)
             
             # 更新舊訊息（如果存在）
             if old_message:
@@ -1159,16 +1242,9 @@ class MusicPlayerCog(commands.Cog):
                 # 轉換為 0-based index
                 target_index = index - 1
                 
-                # 嘗試跳轉
+                # 嘗試跳轉（編號無效時拋出 QueueError，由下方統一回覆）
                 song = self.player.queue.jump_to(target_index)
                 
-                if song is None:
-                    await interaction.followup.send(
-                        f"找不到編號為 {index} 的歌曲（範圍：1-{len(self.player.queue)}）",
-                        ephemeral=True
-                    )
-                    return
-                
                 # 先標記手動操作，再停止當前播放
                 self.player.state.mark_manual_operation()
                 await self.player.stop()
@@ -1201,13 +1277,17 @@ class MusicPlayerCog(commands.Cog):
             return []
         
         try:
+            current_folded = current.casefold()
             choices = []
-            for i, song in enumerate(self.player.queue):
-                display = f"{i + 1}. {song.title}"
-                if current in str(i + 1) or current.lower() in song.title.lower():
-                    choices.append(app_commands.Choice(name=display[:100], value=i + 1))
-            
-            return choices[:25]
+            for number, song in enumerate(self.player.queue, start=1):
+                if current in str(number) or current_folded in song.title_folded:
+                    display = f"{number}. {song.title}"
+                    choices.append(app_commands.Choice(name=display[:100], value=number))
+                    # Discord 最多顯示 25 個選項，湊滿即停止掃描
+                    if len(choices) == 25:
+                        break
+            
+            return choices
         except Exception as e:
             logger.error(f"Autocomplete 時發生錯誤: {e}")
             return []
@@ -1225,25 +1305,17 @@ class MusicPlayerCog(commands.Cog):
             return
         
         try:
-            # 轉換為 0-based index
-            target_index = index - 1
-            
-            # 取得歌曲資訊
-            songs = list(self.player.queue)
-            if target_index < 0 or target_index >= len(songs):
+            # 依編號直接移除（1-based，索引無效時返回 None）
+            song = await self.player.queue.remove_by_index(index)
+            if song is None:
                 await interaction.followup.send(
                     f"找不到編號為 {index} 的歌曲",
                     ephemeral=True
                 )
                 return
             
-            song = songs[target_index]
-            
-            # 移除
-            await self.player.queue.remove(song.id)
-            
-            # 更新 UI
-            await self._refresh_player_ui()
+            # 更新 UI（連續移除時合併為一次刷新）
+            self._schedule_refresh()
             
             embed = self.embed_builder.removed_song_embed(song)
             await interaction.followup.send(embed=embed)
@@ -1254,20 +1326,69 @@ class MusicPlayerCog(commands.Cog):
     
     # ==================== 背景任務 ====================
     
-    @tasks.loop(seconds=EMBED_UPDATE_INTERVAL)
+    @tasks.loop(seconds=EMBED_UPDATE_TICK)
     async def update_embed(self):
-        """定期更新播放器嵌入"""
+        """
+        在播放進度跨入下一格時更新播放器嵌入
+        
+        每次執行後依進度計算下一格的時間點並調整間隔；
+        暫停或閒置時退回 EMBED_UPDATE_INTERVAL，由 _wake_update_embed 提前喚醒
+        """
         try:
             if not self.player or not self.player.is_playing:
+                self.update_embed.change_interval(seconds=EMBED_UPDATE_INTERVAL)
+                return
+            
+            song = self.player.queue.current
+            if not song:
+                self.update_embed.change_interval(seconds=EMBED_UPDATE_INTERVAL)
+                return
+            
+            position = self.player.state.current_position
+            self.update_embed.change_interval(
+                seconds=self._seconds_to_next_step(song.duration, position)
+            )
+            
+            progress_key = (song.id, self._progress_step(song.duration, position))
+            if progress_key == self._last_progress_key:
                 return
+            self._last_progress_key = progress_key
             
             await self._refresh_player_ui()
             
         except Exception as e:
             logger.error(f"更新播放器嵌入時發生錯誤: {e}")
     
+    def _wake_update_embed(self) -> None:
+        """開始播放或恢復播放時啟動更新任務，若正在等待較長間隔則提前喚醒"""
+        self.update_embed_task.change_interval(seconds=EMBED_UPDATE_TICK)
+        if not self.update_embed_task.is_running():
+            self.update_embed_task.start()
+    
     # ==================== 工具方法 ====================
     
+    @staticmethod
+    def _progress_step(duration: int, position: int) -> int:
+        """
+        取得目前的進度格數（與進度條填滿格數一致）
+        
+        沒有時長（直播等）時改以 EMBED_UPDATE_INTERVAL 為單位，維持原本的更新頻率
+        """
+        if duration > 0:
+            return EmbedBuilder.progress_cells(position, duration)
+        return position // EMBED_UPDATE_INTERVAL
+    
+    @classmethod
+    def _seconds_to_next_step(cls, duration: int, position: int) -> int:
+        """計算距離下一個進度格數的秒數，限制在 EMBED_UPDATE_TICK 到 EMBED_UPDATE_INTERVAL 之間"""
+        step = cls._progress_step(duration, position)
+        if duration > 0:
+            # 第 step + 1 格開始的秒數（無條件進位）
+            next_position = -(-(step + 1) * duration // PROGRESS_BAR_LENGTH)
+        else:
+            next_position = (step + 1) * EMBED_UPDATE_INTERVAL
+        return max(EMBED_UPDATE_TICK, min(next_position - position, EMBED_UPDATE_INTERVAL))
+    
     async def _connect_voice_with_retry(
         self, 
         channel: discord.VoiceChannel
@@ -1329,23 +1450,38 @@ class MusicPlayerCog(commands.Cog):
                 self.player.state.mark_manual_operation()
                 await self.player.stop()
                 
-                # 斷開語音連線
-                if self.player.voice_client:
-                    await self.player.voice_client.disconnect()
+                # 快取管理任務先結束，避免在取消預載後又排入新的預載
+                await self.player.cancel_background_tasks()
                 
-                # 等待一下讓 FFmpeg 完全釋放檔案
-                await asyncio.sleep(0.5)
+                # 停止後彼此獨立的收尾同時進行：斷開語音連線、清空佇列、取消預載，
+                # 並等待一下讓 FFmpeg 完全釋放檔案
+                cleanup_steps = [
+                    self.player.queue.clear(),
+                    self.player.cache.cancel_all_preloads_and_wait(),
+                    asyncio.sleep(0.5),
+                ]
+                if self.player.voice_client:
+                    cleanup_steps.append(self.player.voice_client.disconnect())
                 
-                # 清空佇列
-                await self.player.queue.clear()
+                results = await asyncio.gather(*cleanup_steps, return_exceptions=True)
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.warning(f"清理資源時部分步驟失敗: {result}")
                 
-                # 清理快取（先取消預載，再刪除檔案）
-                await self.player.cache.cancel_all_preloads_and_wait()
-                self.player.cache.clear()
+                # 預載已取消且 FFmpeg 已釋放，才刪除快取檔案
+                await self.player.cache.clear()
             
             # 重置狀態
+            self._pending_player_embed = None
+            self._player_edit_task = None
+            self._last_player_state = None
+            self._last_progress_key = None
+            self._pending_refresh = None
             self.player_message = None
             self.playlist_message = None
+            if self.pagination_view:
+                self.pagination_view.stop()
+            self.pagination_view = None
             self.player_view = None
             self.current_playlist_page = 1
             
@@ -1357,19 +1493,10 @@ class MusicPlayerCog(commands.Cog):
         except Exception as e:
             logger.exception(f"清理資源時發生錯誤: {e}")
 
-    async def _ensure_ytdlp_current(self) -> None:
-        """依使用情況節流檢查，並避免多個指令同時執行 pip。"""
-        now = time.monotonic()
-        if now - (self.last_yt_dlp_check or 0) <= YTDLP_UPDATE_INTERVAL:
-            return
-
-        async with self._yt_dlp_update_lock:
-            now = time.monotonic()
-            if now - (self.last_yt_dlp_check or 0) <= YTDLP_UPDATE_INTERVAL:
-                return
-
-            await self._check_ytdlp_update()
-            self.last_yt_dlp_check = time.monotonic()
+    @tasks.loop(seconds=YTDLP_UPDATE_INTERVAL)
+    async def ytdlp_update_loop(self):
+        """定期在背景檢查 yt-dlp 更新（loop 本身保證同時只有一次 pip 執行）"""
+        await self._check_ytdlp_update()
 
     async def _check_ytdlp_update(self) -> None:
         """先用 pip dry-run 檢查差異，有更新時才安裝。"""
@@ -1523,11 +1650,12 @@ class MusicPlayerCog(commands.Cog):
                 logger.warning("Bot 被動斷線，啟動自動重連")
                 self.reconnect_attempts = 0
                 if not self.voice_reconnect_loop.is_running():
+                    self.voice_reconnect_loop.change_interval(seconds=RECONNECT_BACKOFF_BASE)
                     self.voice_reconnect_loop.start()
             else:
                 logger.debug("Bot 離開語音頻道（無需重連）")
     
-    @tasks.loop(seconds=RECONNECT_INTERVAL)
+    @tasks.loop(seconds=RECONNECT_BACKOFF_BASE)
     async def voice_reconnect_loop(self):
         """自動重連任務"""
         try:
@@ -1555,9 +1683,20 @@ class MusicPlayerCog(commands.Cog):
             await self._attempt_reconnect()
             self.reconnect_attempts += 1
             
+            # 指數退避加隨機抖動，避免語音服務恢復時與其他連線同時重試
+            delay = self._reconnect_delay(self.reconnect_attempts)
+            self.voice_reconnect_loop.change_interval(seconds=delay)
+            logger.debug(f"下次重連將在 {delay:.1f} 秒後")
+            
         except Exception as e:
             logger.exception(f"重連任務執行時發生錯誤: {e}")
     
+    @staticmethod
+    def _reconnect_delay(attempts: int) -> float:
+        """計算第 attempts 次失敗後的重連間隔（指數退避，扣除最多 1/4 的隨機抖動）"""
+        delay = min(RECONNECT_BACKOFF_BASE * 2 ** attempts, RECONNECT_BACKOFF_MAX)
+        return delay * (1 - random.random() / 4)
+    
     async def _attempt_reconnect(self):
         """嘗試重新連接"""
         if not self.last_voice_channel or not self.player:
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import sys
-import traceback
 from datetime import datetime
 from pathlib import Path
 
@@ -24,14 +24,24 @@ class CustomHelpCommand(commands.HelpCommand):
             description="以下是目前可用的指令列表",
             color=discord.Color.blue(),
         )
-        for cog, commands_list in mapping.items():
-            filtered = await self.filter_commands(commands_list, sort=True)
-            if not filtered:
+        # 所有指令只過濾一次，再依 Cog 分組（維持 mapping 的 Cog 順序）
+        filtered = await self.filter_commands(
+            [cmd for commands_list in mapping.values() for cmd in commands_list],
+            sort=True,
+        )
+        grouped: dict[commands.Cog | None, list[commands.Command]] = {
+            cog: [] for cog in mapping
+        }
+        for cmd in filtered:
+            grouped.setdefault(cmd.cog, []).append(cmd)
+
+        for cog, commands_list in grouped.items():
+            if not commands_list:
                 continue
             name = cog.qualified_name if cog else "未分類"
             value = "\n".join(
                 f"`{self.context.clean_prefix}{cmd.name}` - {cmd.short_doc}"
-                for cmd in filtered
+                for cmd in commands_list
             )
             embed.add_field(name=name, value=value, inline=False)
         embed.set_footer(
@@ -79,6 +89,13 @@ class MeowBot(commands.Bot):
         intents = discord.Intents.default()
         intents.members = True
         intents.message_content = True
+        # 沒有任何 Cog 監聽的高頻事件不訂閱，省下 gateway 解碼與分派
+        intents.typing = False
+        intents.invites = False
+        intents.webhooks = False
+        intents.integrations = False
+        intents.auto_moderation = False
+        intents.guild_scheduled_events = False
 
         super().__init__(
             command_prefix=commands.when_mentioned,
@@ -92,13 +109,17 @@ class MeowBot(commands.Bot):
     @classmethod
     def discover_extension_names(cls) -> tuple[str, ...]:
         """Return loadable top-level Cog module names in deterministic order."""
+        # DirEntry 已帶有名稱與檔案類型，不必為每個檔案建立 Path 物件
+        with os.scandir(cls.cogs_directory) as entries:
+            names = [
+                entry.name[:-3]
+                for entry in entries
+                if entry.name.endswith(".py") and entry.is_file()
+            ]
         return tuple(
-            path.stem
-            for path in sorted(
-                cls.cogs_directory.glob("*.py"),
-                key=lambda item: item.name.casefold(),
-            )
-            if path.stem != "__init__" and path.stem.isidentifier()
+            name
+            for name in sorted(names, key=str.casefold)
+            if name != "__init__" and name.isidentifier()
         )
 
     @classmethod
@@ -150,16 +171,22 @@ class MeowBot(commands.Bot):
             logger.opt(exception=error).critical("[初始化] 核心管理模組載入失敗")
             raise
 
+        extensions: list[tuple[str, str]] = []
         for extension_name in self.discover_extension_names():
             full_path = self.extension_path(extension_name)
             if full_path is None or full_path == self.management_extension:
                 continue
+            logger.info(f"[初始化] 載入 Extension: {extension_name}")
+            extensions.append((extension_name, full_path))
 
-            try:
-                logger.info(f"[初始化] 載入 Extension: {extension_name}")
-                await self.load_extension(full_path)
-            except Exception as error:
-                logger.opt(exception=error).error(
+        # 同時載入，讓各 Cog 的 cog_load（例如音樂模組準備 FFmpeg）彼此重疊
+        results = await asyncio.gather(
+            *(self.load_extension(full_path) for _, full_path in extensions),
+            return_exceptions=True,
+        )
+        for (extension_name, _), result in zip(extensions, results):
+            if isinstance(result, Exception):
+                logger.opt(exception=result).error(
                     f"[初始化] Extension 載入失敗: {extension_name}"
                 )
 
@@ -183,12 +210,6 @@ def _truncate(value: object, limit: int) -> str:
     return f"{text[:limit - 1]}…"
 
 
-def _format_exception(error: BaseException) -> str:
-    return "".join(
-        traceback.format_exception(type(error), error, error.__traceback__)
-    ).rstrip()
-
-
 def _channel_description(
     guild: discord.Guild | None,
     channel: discord.abc.GuildChannel | discord.Thread | discord.PartialMessageable | None,
@@ -241,10 +262,9 @@ async def on_command_error(ctx: commands.Context, error: commands.CommandError)
 
     actual_error = error.original if isinstance(error, commands.CommandInvokeError) else error
     channel_description = _channel_description(ctx.guild, ctx.channel)
-    error_traceback = _format_exception(actual_error)
-    logger.error(
-        f"{channel_description}/{ctx.author.name}({ctx.author.id}):"
-        f"{actual_error}\n{error_traceback}"
+    # traceback 交由 Loguru 在各 sink 輸出時才格式化
+    logger.opt(exception=actual_error).error(
+        f"{channel_description}/{ctx.author.name}({ctx.author.id}):{actual_error}"
     )
 
     embed = discord.Embed(
@@ -289,10 +309,9 @@ async def on_app_command_error(
         error.original if isinstance(error, app_commands.CommandInvokeError) else error
     )
     channel_description = _channel_description(interaction.guild, interaction.channel)
-    error_traceback = _format_exception(actual_error)
-    logger.error(
+    logger.opt(exception=actual_error).error(
         f"{channel_description}/{interaction.user.name}({interaction.user.id}):"
-        f"{actual_error}\n{error_traceback}"
+        f"{actual_error}"
     )
 
     embed = discord.Embed(
@@ -322,7 +341,16 @@ def set_logger() -> None:
     logger.remove()
     debug_mode = os.getenv("DEBUG", "").lower() in ("true", "1", "yes")
 
-    logger.add(sys.stdout, level="DEBUG" if debug_mode else "INFO", colorize=True)
+    # enqueue=True：訊息仍在呼叫端格式化，但寫入 sink、檔案輪替與 zip 壓縮
+    # 改由背景執行緒處理，磁碟 I/O 不會卡住事件迴圈
+    logger.add(
+        sys.stdout,
+        level="DEBUG" if debug_mode else "INFO",
+        colorize=True,
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
+    )
     logger.add(
         "./logs/system.log",
         rotation="7 days",
@@ -331,6 +359,9 @@ def set_logger() -> None:
         compression="zip",
         level="INFO",
         format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}",
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
     )
 
 
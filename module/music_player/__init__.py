@@ -43,7 +43,9 @@ from .constants import (
     CACHE_WINDOW_BEHIND,
     CACHE_WINDOW_AHEAD,
     CACHE_DIR,
+    CACHE_MAX_BYTES,
     PRELOAD_TIMEOUT,
+    CACHE_CHANGE_DEBOUNCE,
     # 下載
     YTDLP_EXTRACT_TIMEOUT,
     YTDLP_PLAYLIST_TIMEOUT,
@@ -55,15 +57,19 @@ from .constants import (
     PROGRESS_BAR_LENGTH,
     PROGRESS_BAR_FILLED,
     PROGRESS_BAR_EMPTY,
+    PROGRESS_BARS,
     EMBED_UPDATE_INTERVAL,
+    EMBED_UPDATE_TICK,
     # 重連
     RECONNECT_MAX_ATTEMPTS,
-    RECONNECT_INTERVAL,
+    RECONNECT_BACKOFF_BASE,
+    RECONNECT_BACKOFF_MAX,
     # 語音連線
     VOICE_CONNECT_MAX_RETRIES,
     VOICE_CONNECT_RETRY_DELAY,
     # 防抖
     MANUAL_OPERATION_DEBOUNCE,
+    UI_REFRESH_DEBOUNCE,
 )
 
 __all__ = [
@@ -97,7 +103,9 @@ __all__ = [
     "CACHE_WINDOW_BEHIND",
     "CACHE_WINDOW_AHEAD",
     "CACHE_DIR",
+    "CACHE_MAX_BYTES",
     "PRELOAD_TIMEOUT",
+    "CACHE_CHANGE_DEBOUNCE",
     "YTDLP_EXTRACT_TIMEOUT",
     "YTDLP_PLAYLIST_TIMEOUT",
     "YTDLP_DOWNLOAD_TIMEOUT",
@@ -107,10 +115,14 @@ __all__ = [
     "PROGRESS_BAR_LENGTH",
     "PROGRESS_BAR_FILLED",
     "PROGRESS_BAR_EMPTY",
+    "PROGRESS_BARS",
     "EMBED_UPDATE_INTERVAL",
+    "EMBED_UPDATE_TICK",
     "RECONNECT_MAX_ATTEMPTS",
-    "RECONNECT_INTERVAL",
+    "RECONNECT_BACKOFF_BASE",
+    "RECONNECT_BACKOFF_MAX",
     "VOICE_CONNECT_MAX_RETRIES",
     "VOICE_CONNECT_RETRY_DELAY",
     "MANUAL_OPERATION_DEBOUNCE",
+    "UI_REFRESH_DEBOUNCE",
 ]
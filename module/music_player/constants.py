@@ -15,9 +15,11 @@ CACHE_WINDOW_BEHIND = 2      # 當前歌曲之前保留幾首快取
 CACHE_WINDOW_AHEAD = 3       # 當前歌曲之後保留幾首快取
 
 CACHE_DIR = "./temp/music"   # 快取目錄
+CACHE_MAX_BYTES = 500 * 1024 * 1024  # 快取總大小上限（bytes），超過時才淘汰窗口外的快取；設為 0 則一律刪除窗口外快取
 
 # 預載設定
 PRELOAD_TIMEOUT = 30         # 等待預載完成的超時時間（秒）
+CACHE_CHANGE_DEBOUNCE = 0.3  # 連續切歌時合併快取清理與預載的等待時間（秒）
 
 # ─────────────────────────────────────────────────────────
 #  下載設定 (yt-dlp)
@@ -41,16 +43,23 @@ PAGINATION_VIEW_TIMEOUT = 120.0  # 翻頁按鈕超時（秒）
 PROGRESS_BAR_LENGTH = 15         # 進度條長度（格數）
 PROGRESS_BAR_FILLED = "▰"        # 進度條填滿符號
 PROGRESS_BAR_EMPTY = "▱"         # 進度條空白符號
+# 0 ~ PROGRESS_BAR_LENGTH 格填滿的所有進度條，預先建好直接以格數查表
+PROGRESS_BARS = tuple(
+    PROGRESS_BAR_FILLED * filled + PROGRESS_BAR_EMPTY * (PROGRESS_BAR_LENGTH - filled)
+    for filled in range(PROGRESS_BAR_LENGTH + 1)
+)
 
 # 嵌入更新
-EMBED_UPDATE_INTERVAL = 15       # 播放器嵌入更新間隔（秒）
+EMBED_UPDATE_INTERVAL = 15       # 無時長（直播等）時的播放器嵌入更新間隔（秒）
+EMBED_UPDATE_TICK = 1            # 播放進度檢查間隔（秒），進度條格數變化時才編輯訊息
 
 # ─────────────────────────────────────────────────────────
 #  重連設定
 # ─────────────────────────────────────────────────────────
 
 RECONNECT_MAX_ATTEMPTS = 15      # 最大重連嘗試次數
-RECONNECT_INTERVAL = 15          # 重連間隔（秒）
+RECONNECT_BACKOFF_BASE = 1       # 重連退避起始間隔（秒），每次失敗加倍
+RECONNECT_BACKOFF_MAX = 60       # 重連退避間隔上限（秒）
 
 # ─────────────────────────────────────────────────────────
 #  語音連線設定
@@ -64,3 +73,4 @@ VOICE_CONNECT_RETRY_DELAY = 2    # 語音連線重試間隔（秒）
 # ─────────────────────────────────────────────────────────
 
 MANUAL_OPERATION_DEBOUNCE = 1.0  # 手動操作後忽略自動切歌的時間（秒）
+UI_REFRESH_DEBOUNCE = 1.0        # 連續移除歌曲時合併播放器 UI 刷新的等待時間（秒）
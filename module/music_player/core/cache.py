@@ -3,7 +3,7 @@
 
 策略：
 - 保留當前歌曲前後 N 首的快取
-- 自動刪除超出範圍的快取
+- 超出範圍的快取在總大小超過上限時才刪除，優先淘汰使用次數少、較久未使用的
 - 背景預載下幾首歌曲
 - 避免硬碟空間無限增長
 
@@ -11,19 +11,35 @@
     佇列：[1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
                       ↑ 當前第 5 首
     保留：[3, 4, 5, 6, 7, 8] 共 6 首快取
-    刪除：[1, 2] 的快取（太舊）
+    候選：[1, 2] 的快取（超過大小上限時依使用次數、最後使用時間淘汰）
     預載：[6, 7, 8]（如果還沒下載）
 """
 
 import asyncio
+import errno
+import os
+import shutil
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Dict, Optional, Set, TYPE_CHECKING
 from loguru import logger
 
+from ..constants import CACHE_CHANGE_DEBOUNCE, CACHE_MAX_BYTES
+
 if TYPE_CHECKING:
     from .queue import Song, MusicQueue
 
 
+@dataclass(slots=True)
+class CacheEntry:
+    """快取索引項目：檔案大小與使用紀錄（決定窗口外快取的淘汰順序）"""
+    
+    size: int
+    freq: int = 0
+    last_access: float = 0.0
+
+
 class CacheManager:
     """
     滑動窗口快取管理器
@@ -31,8 +47,9 @@ class CacheManager:
     使用方式：
         cache = CacheManager(cache_dir="./cache", window_behind=2, window_ahead=3)
         
-        # 每次歌曲切換時呼叫
-        await cache.on_song_change(queue.all_songs, queue.current_index_zero_based, downloader)
+        # 每次歌曲切換時呼叫（傳入窗口片段即可）
+        songs, index = queue.window(cache.window_behind, cache.window_ahead)
+        await cache.on_song_change(songs, index, downloader)
         
         # 檢查快取
         if cache.exists(song.id):
@@ -43,7 +60,9 @@ class CacheManager:
         self,
         cache_dir: str,
         window_behind: int = 2,
-        window_ahead: int = 3
+        window_ahead: int = 3,
+        max_concurrent_preloads: int = 2,
+        max_bytes: int = CACHE_MAX_BYTES
     ):
         """
         初始化快取管理器
@@ -53,6 +72,9 @@ class CacheManager:
             window_behind: 當前歌曲之前保留幾首快取（>= 0）
             window_ahead: 當前歌曲之後保留幾首快取（>= 0）
                          設為 0 表示永久保存所有快取
+            max_concurrent_preloads: 同時進行的預載下載數量上限（>= 1）
+            max_bytes: 快取總大小上限（bytes），窗口外的快取只在超過上限時淘汰；
+                       設為 0 表示一律刪除窗口外的快取
         """
         # 驗證參數
         if window_behind < 0:
@@ -61,19 +83,37 @@ class CacheManager:
         if window_ahead < 0:
             logger.warning(f"window_ahead 不能為負數，已設為 0")
             window_ahead = 0
+        if max_concurrent_preloads < 1:
+            logger.warning(f"max_concurrent_preloads 至少為 1，已設為 1")
+            max_concurrent_preloads = 1
         
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
         self.window_behind = window_behind
         self.window_ahead = window_ahead
+        self.max_bytes = max(0, max_bytes)
         
         # 預載任務追蹤
         self._preload_tasks: Dict[str, asyncio.Task] = {}
+        # 限制同時下載的預載數量，避免佔滿頻寬或觸發 YouTube 限流；超出的任務排隊等待
+        self._preload_sem = asyncio.Semaphore(max_concurrent_preloads)
+        # 已取得名額、實際在下載中的預載任務（排隊中的不算）
+        self._active_preloads: Set[asyncio.Task] = set()
+        
+        # 歌曲切換合併：連續切歌只保留最新一次的參數，由單一任務延遲處理
+        self._pending_change: Optional[tuple] = None
+        self._change_task: Optional[asyncio.Task] = None
+        # 最後一次處理的窗口 (current_index, 窗口內 song_id)，相同時略過清理與預載
+        self._last_window: Optional[tuple] = None
         
         # 當前保留的 song_id 集合（用於判斷是否應該刪除）
         self._keep_ids: Set[str] = set()
         
+        # 快取索引：song_id -> CacheEntry（大小、使用次數、最後使用時間），
+        # 啟動時掃描一次，之後隨 put / 刪除更新；查詢、統計與清理都不必再逐一 stat 目錄中的檔案
+        self._index: Dict[str, CacheEntry] = self._scan_index()
+        
         # 記錄初始化訊息
         preserve_mode = "永久保存模式" if window_ahead == 0 else "滑動視窗模式"
         logger.debug(
@@ -83,6 +123,47 @@ class CacheManager:
     
     # === 路徑與檢查 ===
     
+    def _scan_index(self) -> Dict[str, CacheEntry]:
+        """掃描快取目錄建立索引（DirEntry 已帶有名稱與類型，只對 .opus 取大小）"""
+        index: Dict[str, CacheEntry] = {}
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".opus"):
+                    continue
+                try:
+                    if entry.is_file():
+                        index[entry.name[:-5]] = CacheEntry(entry.stat().st_size)
+                except OSError:
+                    pass
+        return index
+    
+    def _index_file(self, song_id: str) -> bool:
+        """
+        將磁碟上的快取檔案加入索引
+        
+        Returns:
+            檔案是否存在
+        """
+        try:
+            size = self.get_path(song_id).stat().st_size
+        except OSError:
+            self._index.pop(song_id, None)
+            return False
+        
+        entry = self._index.get(song_id)
+        if entry is None:
+            self._index[song_id] = CacheEntry(size)
+        else:
+            entry.size = size
+        return True
+    
+    def _touch(self, song_id: str) -> None:
+        """記錄一次快取使用"""
+        entry = self._index.get(song_id)
+        if entry is not None:
+            entry.freq += 1
+            entry.last_access = time.monotonic()
+    
     def get_path(self, song_id: str) -> Path:
         """
         取得歌曲快取的完整路徑
@@ -105,7 +186,8 @@ class CacheManager:
         Returns:
             快取是否存在
         """
-        return self.get_path(song_id).exists()
+        # 索引未命中時再檢查磁碟，收錄未經 put 寫入的檔案
+        return song_id in self._index or self._index_file(song_id)
     
     def get(self, song_id: str) -> Optional[str]:
         """
@@ -117,16 +199,16 @@ class CacheManager:
         Returns:
             快取路徑字串，若不存在則返回 None
         """
-        path = self.get_path(song_id)
-        if path.exists():
-            return str(path)
+        if self.exists(song_id):
+            self._touch(song_id)
+            return str(self.get_path(song_id))
         return None
     
     def put(self, song_id: str, file_path: str) -> None:
         """
         記錄快取（將檔案視為已快取）
         
-        如果檔案不在快取目錄中，會嘗試移動或複製
+        如果檔案不在快取目錄中，會移動過去（跨檔案系統時改為複製後刪除）
         
         Args:
             song_id: 歌曲 ID
@@ -135,45 +217,46 @@ class CacheManager:
         target = self.get_path(song_id)
         source = Path(file_path)
         
-        # 如果檔案已在正確位置，不需要做什麼
+        # 如果檔案已在正確位置，只需加入索引
         if source == target:
+            self._index_file(song_id)
             return
         
-        # 如果目標已存在，直接返回
-        if target.exists():
-            return
-        
-        # 嘗試移動檔案
+        # 嘗試移動檔案（os.replace 在同一檔案系統上為原子操作，目標已存在時直接覆蓋）
         try:
-            if source.exists():
-                source.rename(target)
-                logger.debug(f"移動快取檔案: {song_id}")
+            try:
+                os.replace(source, target)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # 跨檔案系統無法 rename，改為複製後刪除
+                shutil.move(source, target)
+            logger.debug(f"移動快取檔案: {song_id}")
+        except FileNotFoundError:
+            # 來源已不存在（可能已被移動過），以目標檔案為準
+            pass
         except Exception as e:
             logger.warning(f"無法移動快取檔案: {e}")
+        
+        self._index_file(song_id)
     
-    def clear(self) -> int:
+    async def clear(self) -> int:
         """
         clear_all 的別名
         """
-        return self.clear_all()
+        return await self.clear_all()
     
     def get_cache_size(self) -> int:
         """
         取得目前快取總大小（bytes）
         """
-        total = 0
-        for file in self.cache_dir.glob("*.opus"):
-            try:
-                total += file.stat().st_size
-            except Exception:
-                pass
-        return total
+        return sum(entry.size for entry in self._index.values())
     
     def get_cache_count(self) -> int:
         """
         取得目前快取檔案數量
         """
-        return len(list(self.cache_dir.glob("*.opus")))
+        return len(self._index)
     
     # === 核心邏輯 ===
     
@@ -190,75 +273,149 @@ class CacheManager:
         1. 清理滑動窗口外的舊快取（除非 window_ahead=0，表示永久保存）
         2. 背景預載接下來的歌曲
         
+        清理與預載會延遲 CACHE_CHANGE_DEBOUNCE 秒後在背景執行，
+        期間的多次切換只處理最後一次，連續跳歌時不會反覆掃描、刪除與啟動下載
+        
         Args:
-            queue: 所有歌曲列表
-            current_index: 當前歌曲索引（0-based）
+            queue: 歌曲列表（整個佇列或包含窗口的片段，例如 MusicQueue.window 的結果）
+            current_index: 當前歌曲在 queue 中的索引（0-based）
             downloader: YTDLPDownloader 實例
         """
         if not queue or current_index < 0:
             return
         
+        # 永久保存模式（window_ahead=0）不清理也不預載，保留集合用不到，不必每次重建
+        if self.window_ahead == 0:
+            logger.debug("快取管理：永久保存模式已啟用，跳過自動清理與預載")
+            return
+        
+        self._pending_change = (queue, current_index, downloader)
+        if self._change_task is None or self._change_task.done():
+            self._change_task = asyncio.create_task(
+                self._flush_song_change(),
+                name="cache_song_change"
+            )
+    
+    async def _flush_song_change(self) -> None:
+        """等待切歌穩定後，以最新的參數執行清理與預載"""
+        while self._pending_change is not None:
+            await asyncio.sleep(CACHE_CHANGE_DEBOUNCE)
+            queue, current_index, downloader = self._pending_change
+            self._pending_change = None
+            try:
+                await self._apply_song_change(queue, current_index, downloader)
+            except Exception as e:
+                logger.warning(f"快取管理失敗: {e}")
+    
+    async def _apply_song_change(
+        self,
+        queue: List["Song"],
+        current_index: int,
+        downloader
+    ) -> None:
+        """更新保留窗口、取消窗口外預載、清理舊快取並預載下幾首"""
         # 更新保留的 song_id 集合（用於預載和選擇性清理）
-        self._update_keep_ids(queue, current_index)
+        # 暫停/恢復、重連等重複呼叫時窗口不變，整輪工作都可以略過
+        if not self._update_keep_ids(queue, current_index):
+            logger.debug("快取窗口未變更，跳過清理與預載")
+            return
         
-        # 只在非永久保存模式（window_ahead > 0）時清理舊快取
-        if self.window_ahead > 0:
-            await self._cleanup_old()
-        else:
-            logger.debug("快取管理：永久保存模式已啟用，跳過自動清理")
+        # 已移出窗口的歌曲不再需要，停止仍在進行的預載
+        self._cancel_stale_preloads()
         
-        # 預載新歌（當 window_ahead > 0 時進行）
-        if self.window_ahead > 0:
-            await self._preload_ahead(queue, current_index, downloader)
-        else:
-            logger.debug("快取管理：永久保存模式已啟用，跳過預載")
+        await self._cleanup_old()
+        await self._preload_ahead(queue, current_index, downloader)
     
-    def _update_keep_ids(self, queue: List["Song"], current_index: int) -> None:
+    def _update_keep_ids(self, queue: List["Song"], current_index: int) -> bool:
         """
-        更新應保留的 song_id 集合
+        更新應保留的 song_id 集合（只在滑動窗口模式使用）
         
-        永久保存模式（window_ahead=0）：保留所有歌曲 ID（由清理邏輯處理是否實際刪除）
-        滑動窗口模式（window_ahead>0）：只保留窗口內的歌曲 ID
+        集合只含窗口內的 window_behind + 1 + window_ahead 首，
+        成本與佇列長度無關
+        
+        Returns:
+            窗口是否與上次不同
         """
-        if self.window_ahead == 0:
-            # 永久保存模式：保留所有下載的歌曲
-            self._keep_ids = {song.id for song in queue}
-            logger.debug(
-                f"快取窗口更新（永久保存模式）: 保留全部 {len(self._keep_ids)} 首歌曲"
-            )
-        else:
-            # 滑動窗口模式：只保留窗口內的歌曲
-            keep_start = max(0, current_index - self.window_behind)
-            keep_end = min(len(queue), current_index + self.window_ahead + 1)
-            
-            self._keep_ids = {queue[i].id for i in range(keep_start, keep_end)}
-            
-            logger.debug(
-                f"快取窗口更新: 保留索引 [{keep_start}, {keep_end}), "
-                f"共 {len(self._keep_ids)} 首"
-            )
+        keep_start = max(0, current_index - self.window_behind)
+        keep_end = min(len(queue), current_index + self.window_ahead + 1)
+        
+        window = (current_index, tuple(song.id for song in queue[keep_start:keep_end]))
+        if window == self._last_window:
+            return False
+        self._last_window = window
+        
+        self._keep_ids = set(window[1])
+        
+        logger.debug(
+            f"快取窗口更新: 保留索引 [{keep_start}, {keep_end}), "
+            f"共 {len(self._keep_ids)} 首"
+        )
+        return True
     
     async def _cleanup_old(self) -> None:
         """
         清理滑動窗口外的快取
+        
+        總大小未超過 max_bytes 時全部保留（重播或跳回時不必重新下載）；
+        超過時依使用次數由少到多、最後使用時間由舊到新淘汰，直到回到上限以內
         """
-        deleted_count = 0
+        # 只看索引中不在保留集合的歌曲，不需要重新掃描目錄
+        candidates = self._index.keys() - self._keep_ids
+        if not candidates:
+            return
         
-        for file in self.cache_dir.glob("*.opus"):
-            song_id = file.stem
-            
-            # 如果不在保留集合中，刪除
-            if song_id not in self._keep_ids:
-                try:
-                    file.unlink()
-                    deleted_count += 1
-                    logger.debug(f"刪除舊快取: {song_id}")
-                except Exception as e:
-                    logger.warning(f"刪除快取失敗: {song_id} - {e}")
+        victims = self._select_victims(candidates)
+        if not victims:
+            return
+        
+        # 逐一 unlink 是阻塞式 I/O，移到執行緒避免卡住事件迴圈
+        deleted_ids = await asyncio.to_thread(self._cleanup_old_sync, victims)
+        for song_id in deleted_ids:
+            self._index.pop(song_id, None)
         
+        deleted_count = len(deleted_ids)
         if deleted_count > 0:
             logger.debug(f"清理了 {deleted_count} 個舊快取")
     
+    def _select_victims(self, candidates: Set[str]) -> List[str]:
+        """從窗口外的候選中挑出需要刪除的歌曲，使總大小回到 max_bytes 以內"""
+        if self.max_bytes == 0:
+            return list(candidates)
+        
+        excess = self.get_cache_size() - self.max_bytes
+        if excess <= 0:
+            return []
+        
+        victims = []
+        index = self._index
+        ordered = sorted(
+            candidates,
+            key=lambda song_id: (index[song_id].freq, index[song_id].last_access),
+        )
+        for song_id in ordered:
+            if excess <= 0:
+                break
+            victims.append(song_id)
+            excess -= index[song_id].size
+        return victims
+    
+    def _cleanup_old_sync(self, song_ids: List[str]) -> List[str]:
+        """
+        刪除指定歌曲的快取檔案（在執行緒中執行）
+        
+        Returns:
+            成功刪除的 song_id 列表
+        """
+        deleted_ids = []
+        for song_id in song_ids:
+            try:
+                self.get_path(song_id).unlink(missing_ok=True)
+                deleted_ids.append(song_id)
+                logger.debug(f"刪除舊快取: {song_id}")
+            except Exception as e:
+                logger.warning(f"刪除快取失敗: {song_id} - {e}")
+        return deleted_ids
+    
     async def _preload_ahead(
         self,
         queue: List["Song"],
@@ -302,8 +459,14 @@ class CacheManager:
         Cache 是「通知制」，不應該改變資料模型的狀態。
         """
         try:
-            logger.debug(f"背景預載開始: {song.title}")
-            info, path = await downloader.download(song.url)
+            async with self._preload_sem:
+                task = asyncio.current_task()
+                self._active_preloads.add(task)
+                try:
+                    logger.debug(f"背景預載開始: {song.title}")
+                    _, path = await downloader.download(song.url, song.id)
+                finally:
+                    self._active_preloads.discard(task)
             
             if path:
                 # 只記錄快取（不修改 Song 物件）
@@ -318,8 +481,9 @@ class CacheManager:
         except Exception as e:
             logger.warning(f"背景預載失敗: {song.title} - {e}")
         finally:
-            # 清理任務記錄
-            self._preload_tasks.pop(song.id, None)
+            # 清理任務記錄（被取消後同一首歌可能已重新排入新的預載，不能誤刪）
+            if self._preload_tasks.get(song.id) is asyncio.current_task():
+                del self._preload_tasks[song.id]
     
     # === 預載控制 ===
     
@@ -330,6 +494,13 @@ class CacheManager:
         Returns:
             被取消的任務數量
         """
+        # 尚未執行的切歌處理也一併取消，避免之後又排入新的預載；
+        # 預載被取消後窗口需要重新處理，清除上次的窗口紀錄
+        self._pending_change = None
+        self._last_window = None
+        if self._change_task is not None and not self._change_task.done():
+            self._change_task.cancel()
+        
         cancelled = 0
         for song_id, task in list(self._preload_tasks.items()):
             if not task.done():
@@ -344,6 +515,28 @@ class CacheManager:
         
         return cancelled
 
+    def _cancel_stale_preloads(self) -> int:
+        """
+        取消不在保留集合中的預載任務
+        
+        Returns:
+            被取消的任務數量
+        """
+        cancelled = 0
+        for song_id, task in list(self._preload_tasks.items()):
+            if song_id in self._keep_ids:
+                continue
+            if not task.done():
+                task.cancel()
+                cancelled += 1
+                logger.debug(f"取消窗口外的預載: {song_id}")
+            del self._preload_tasks[song_id]
+        
+        if cancelled > 0:
+            logger.debug(f"取消了 {cancelled} 個窗口外的預載任務")
+        
+        return cancelled
+    
     async def cancel_all_preloads_and_wait(self) -> int:
         """
         取消所有預載任務並等待它們結束
@@ -356,6 +549,8 @@ class CacheManager:
             for task in self._preload_tasks.values()
             if not task.done()
         ]
+        if self._change_task is not None and not self._change_task.done():
+            tasks.append(self._change_task)
 
         cancelled = self.cancel_all_preloads()
         if tasks:
@@ -363,6 +558,22 @@ class CacheManager:
 
         return cancelled
     
+    async def cancel_preload(self, song_id: str) -> bool:
+        """
+        取消特定歌曲的預載並等待它結束（下載子程序會被終止）
+        
+        Returns:
+            是否有進行中的預載被取消
+        """
+        task = self._preload_tasks.pop(song_id, None)
+        if task is None or task.done():
+            return False
+        
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        logger.debug(f"取消預載: {song_id}")
+        return True
+    
     def is_preloading(self, song_id: str) -> bool:
         """
         檢查歌曲是否正在預載
@@ -371,6 +582,13 @@ class CacheManager:
             return False
         return not self._preload_tasks[song_id].done()
     
+    def is_downloading(self, song_id: str) -> bool:
+        """
+        檢查歌曲的預載是否已取得名額並正在下載（還在排隊等待名額的不算）
+        """
+        task = self._preload_tasks.get(song_id)
+        return task is not None and task in self._active_preloads
+    
     async def wait_for_preload(self, song_id: str, timeout: float = 30) -> bool:
         """
         等待特定歌曲的預載完成
@@ -390,21 +608,22 @@ class CacheManager:
         
         task = self._preload_tasks[song_id]
         
-        try:
-            await asyncio.wait_for(asyncio.shield(task), timeout=timeout)
-            return self.exists(song_id)
-        except asyncio.TimeoutError:
+        # asyncio.wait 不會取消或包裝任務，逾時後預載仍在背景繼續；
+        # 呼叫端若要自行下載，必須先 cancel_preload，避免兩個下載寫入同一個檔案
+        done, _ = await asyncio.wait({task}, timeout=timeout)
+        if not done:
             logger.warning(f"等待預載超時: {song_id}")
             return False
-        except Exception:
+        if task.cancelled() or task.exception() is not None:
             return False
+        return self.exists(song_id)
     
     # === 清理 ===
     
-    # 需要清理的媒體檔案副檔名
-    MEDIA_EXTENSIONS = {".opus", ".webm", ".m4a", ".mp3", ".mp4", ".wav", ".ogg", ".flac"}
+    # 需要清理的媒體檔案副檔名（tuple 供 str.endswith 一次比對）
+    MEDIA_SUFFIXES = (".opus", ".webm", ".m4a", ".mp3", ".mp4", ".wav", ".ogg", ".flac")
     
-    def clear_all(self) -> int:
+    async def clear_all(self) -> int:
         """
         清空所有快取（包括未完成轉換的原始檔）
         
@@ -413,20 +632,34 @@ class CacheManager:
         """
         # 先取消所有預載
         self.cancel_all_preloads()
+        self._keep_ids.clear()
+        self._index.clear()
         
+        # 掃描與刪除都是阻塞式 I/O，移到執行緒執行
+        deleted = await asyncio.to_thread(self._clear_all_sync)
+        
+        logger.debug(f"已清空所有快取，共刪除 {deleted} 個檔案")
+        return deleted
+    
+    def _clear_all_sync(self) -> int:
+        """
+        刪除快取目錄中的所有媒體檔案（在執行緒中執行）
+        
+        Returns:
+            被刪除的檔案數量
+        """
         deleted = 0
         # 清理所有媒體檔案，不只是 .opus
-        for file in self.cache_dir.iterdir():
-            if file.is_file() and file.suffix.lower() in self.MEDIA_EXTENSIONS:
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not entry.name.lower().endswith(self.MEDIA_SUFFIXES):
+                    continue
                 try:
-                    file.unlink()
-                    deleted += 1
+                    if entry.is_file():
+                        os.unlink(entry.path)
+                        deleted += 1
                 except Exception as e:
-                    logger.warning(f"刪除快取失敗: {file} - {e}")
-        
-        self._keep_ids.clear()
-        
-        logger.debug(f"已清空所有快取，共刪除 {deleted} 個檔案")
+                    logger.warning(f"刪除快取失敗: {entry.path} - {e}")
         return deleted
     
     def cleanup(self) -> None:
@@ -450,8 +683,9 @@ class CacheManager:
             queue: MusicQueue 實例
             downloader: YTDLPDownloader 實例
         """
+        songs, index = queue.window(self.window_behind, self.window_ahead)
         await self.on_song_change(
-            queue=list(queue),
-            current_index=queue.current_index,
+            queue=songs,
+            current_index=index,
             downloader=downloader,
         )
@@ -24,6 +24,7 @@ from ..utils.errors import (
     PlaybackError,
     VoiceConnectionError,
     QueueEmptyError,
+    QueueError,
 )
 
 if TYPE_CHECKING:
@@ -110,6 +111,9 @@ class MusicPlayer:
         self._playback_session_id = 0
         self._ignored_playback_session_ids: set[int] = set()
         
+        # 追蹤背景任務（快取管理、回調、歌曲結束處理），保留引用並在清理時取消
+        self._background_tasks: set[asyncio.Task] = set()
+        
         logger.debug(f"MusicPlayer 初始化: cache_dir={cache_dir}")
     
     # === 屬性 ===
@@ -217,10 +221,11 @@ class MusicPlayer:
             return None
         
         # 嘗試從快取取得（使用區域變數，不寫回 Song）
+        # 快取索引會隨 put / 清理同步更新，命中即代表檔案存在，不必再 stat 一次
         cache_path = self.cache.get(song.id)
         
-        # 如果沒有快取或檔案不存在，需要下載
-        if not cache_path or not Path(cache_path).exists():
+        # 沒有快取時需要下載
+        if not cache_path:
             logger.debug(f"下載中: {song.title}")
             if self.downloader:
                 info, path = await self.downloader.download(song.url, song.id)
@@ -231,6 +236,7 @@ class MusicPlayer:
                 # 下載完成：更新區域變數和 Song（只在主動下載時更新）
                 cache_path = str(path)
                 song.cached_path = str(path)
+                self.cache.put(song.id, cache_path)
             else:
                 logger.error("無法下載：downloader 未設定")
                 return None
@@ -244,9 +250,11 @@ class MusicPlayer:
         
         # 建立音訊源（使用區域變數 cache_path）
         try:
+            # 快取檔案已是 48kHz 雙聲道 Opus（下載時轉好），直接複製串流，不必每次播放重新編碼
             audio_source = discord.FFmpegOpusAudio(
                 source=cache_path,
-                executable=self.ffmpeg_path
+                executable=self.ffmpeg_path,
+                codec="copy",
             )
         except Exception as e:
             logger.error(f"建立音訊源失敗: {e}")
@@ -275,18 +283,13 @@ class MusicPlayer:
         
         logger.debug(f"開始播放: {song.title}")
         
-        # 觸發快取管理（預載下幾首）
-        asyncio.create_task(
-            self.cache.on_song_change(
-                self.queue.all_songs,
-                self.queue.current_index_zero_based,
-                self.downloader
-            )
-        )
+        # 觸發快取管理（預載下幾首）；只傳入窗口片段，不必複製整個佇列
+        songs, index = self.queue.window(self.cache.window_behind, self.cache.window_ahead)
+        self._spawn(self.cache.on_song_change(songs, index, self.downloader))
         
         # 觸發回調
         if self._on_song_change:
-            asyncio.create_task(self._safe_callback(self._on_song_change))
+            self._spawn(self._safe_callback(self._on_song_change))
         
         return song
     
@@ -396,12 +399,12 @@ class MusicPlayer:
         Returns:
             目標歌曲，若索引無效則返回 None
         """
-        song = self.queue.jump_to(index)
-        if song:
-            return await self.play()
-        else:
+        try:
+            self.queue.jump_to(index)
+        except QueueError:
             logger.warning(f"無效的編號: {index}")
             return None
+        return await self.play()
     
     # === 佇列操作 ===
     
@@ -424,23 +427,8 @@ class MusicPlayer:
             logger.warning(f"無法取得資訊: {info.get('display_message')}")
             return None
         
-        # 建立 Song 物件（確保 duration 為 int）
-        duration = info.get("duration", 0)
-        try:
-            duration = int(float(duration)) if duration else 0
-        except (ValueError, TypeError, OverflowError):
-            duration = 0
-        
-        song = Song(
-            id=info["id"],
-            title=info["title"],
-            url=info["url"],
-            duration=duration,
-            uploader=info["uploader"],
-            uploader_url=info.get("uploader_url", ""),
-            thumbnail=info.get("thumbnail", ""),
-            requester_id=requester_id
-        )
+        # 建立 Song 物件
+        song = Song.from_entry(info, requester_id=requester_id)
         
         # 新增到佇列
         await self.queue.add(song)
@@ -463,26 +451,7 @@ class MusicPlayer:
         if not entries:
             return []
         
-        songs = []
-        for info in entries:
-            # 確保 duration 為 int
-            duration = info.get("duration", 0)
-            try:
-                duration = int(float(duration)) if duration else 0
-            except (ValueError, TypeError, OverflowError):
-                duration = 0
-            
-            song = Song(
-                id=info["id"],
-                title=info["title"],
-                url=info["url"],
-                duration=duration,
-                uploader=info.get("uploader", "未知"),
-                uploader_url=info.get("uploader_url", ""),
-                thumbnail=info.get("thumbnail", ""),
-                requester_id=requester_id
-            )
-            songs.append(song)
+        songs = [Song.from_entry(info, requester_id=requester_id) for info in entries]
         
         # 批次新增
         await self.queue.add_many(songs)
@@ -509,7 +478,7 @@ class MusicPlayer:
             被清空的歌曲數量
         """
         count = await self.queue.clear()
-        self.cache.clear_all()
+        await self.cache.clear_all()
         return count
     
     # === 狀態查詢 ===
@@ -570,9 +539,11 @@ class MusicPlayer:
             logger.error("無法處理歌曲結束：事件循環未設定")
             return
         
-        self._loop.call_soon_threadsafe(
-            lambda: asyncio.create_task(self._handle_song_end(playback_session_id))
-        )
+        self._loop.call_soon_threadsafe(self._schedule_song_end, playback_session_id)
+    
+    def _schedule_song_end(self, playback_session_id: int) -> None:
+        """在事件循環執行緒中建立歌曲結束處理任務（協程也在這裡建立，不在音訊執行緒）"""
+        self._spawn(self._handle_song_end(playback_session_id))
     
     async def _handle_song_end(self, playback_session_id: int) -> None:
         """
@@ -617,6 +588,25 @@ class MusicPlayer:
 
         self._ignored_playback_session_ids.add(current_session_id)
     
+    def _spawn(self, coro: Awaitable[None]) -> asyncio.Task:
+        """建立背景任務並追蹤，完成後自動移除"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+    
+    async def cancel_background_tasks(self) -> None:
+        """取消並等待所有未完成的背景任務（不包含呼叫者自身）"""
+        current = asyncio.current_task()
+        pending = [
+            task for task in self._background_tasks
+            if task is not current and not task.done()
+        ]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    
     async def _safe_callback(self, callback: Callable) -> None:
         """
         安全執行回調
@@ -640,6 +630,7 @@ class MusicPlayer:
         """
         清理資源（程式結束時呼叫）
         """
+        await self.cancel_background_tasks()
         await self.disconnect()
         self.cache.cleanup()
         logger.info("MusicPlayer 已清理")
@@ -5,16 +5,17 @@
 - 無數量上限（允許無限點歌）
 - 支援循環播放（第一首 ↔ 最後一首）
 - 支援跳轉到指定編號
-- 線程安全（使用 asyncio.Lock）
+- 只在事件迴圈中操作；修改方法內沒有 await，不需要加鎖
 """
 
-import asyncio
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Iterator, List, Optional, Tuple
 from loguru import logger
 
+from ..utils.errors import QueueError
 
-@dataclass
+
+@dataclass(slots=True)
 class Song:
     """
     歌曲資料結構
@@ -33,6 +34,50 @@ class Song:
     # 快取相關
     cached_path: Optional[str] = field(default=None, repr=False)  # 本地快取路徑
     
+    # 搜尋用（建立時計算一次，自動完成不必每次按鍵重新轉換大小寫）
+    title_folded: str = field(init=False, repr=False, compare=False)
+    
+    # 時長字串（第一次格式化後記住，時長建立後不會變）
+    _duration_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self.title_folded = self.title.casefold()
+    
+    @classmethod
+    def from_entry(
+        cls,
+        entry: dict,
+        url: Optional[str] = None,
+        requester_id: Optional[int] = None,
+    ) -> "Song":
+        """
+        從 YTDLPDownloader 的解析結果建立歌曲
+        
+        Args:
+            entry: extract_info / extract_playlist 回傳的歌曲資訊
+            url: 覆寫歌曲 URL（例如使用者輸入的原始網址）
+            requester_id: 點歌者的 Discord 用戶 ID
+        """
+        get = entry.get
+        
+        # 確保 duration 為 int（某些平台會回傳 float）
+        duration = get("duration") or 0
+        try:
+            duration = int(float(duration)) if duration else 0
+        except (ValueError, TypeError, OverflowError):
+            duration = 0
+        
+        return cls(
+            id=get("id") or "",
+            title=get("title") or "未知標題",
+            url=url or get("url") or "",
+            duration=duration,
+            uploader=get("uploader") or "未知上傳者",
+            uploader_url=get("uploader_url") or "",
+            thumbnail=get("thumbnail") or "",
+            requester_id=requester_id,
+        )
+    
     @property
     def is_cached(self) -> bool:
         """是否已下載到本地"""
@@ -40,18 +85,16 @@ class Song:
     
     def format_duration(self) -> str:
         """格式化時長（處理 int 和 float 類型）"""
+        if self._duration_str is not None:
+            return self._duration_str
+        
         # 確保是整數（某些平台會回傳 float）
-        duration = int(self.duration) if self.duration is not None else 0
-        
-        if duration >= 3600:
-            hours = duration // 3600
-            minutes = (duration % 3600) // 60
-            seconds = duration % 60
-            return f"{hours}:{minutes:02d}:{seconds:02d}"
-        else:
-            minutes = duration // 60
-            seconds = duration % 60
-            return f"{minutes}:{seconds:02d}"
+        minutes, seconds = divmod(int(self.duration or 0), 60)
+        hours, minutes = divmod(minutes, 60)
+        self._duration_str = (
+            f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+        )
+        return self._duration_str
 
 
 class MusicQueue:
@@ -76,7 +119,6 @@ class MusicQueue:
         self._queue: List[Song] = []
         self._current_index: int = -1
         self._loop: bool = False
-        self._lock = asyncio.Lock()
     
     # === 屬性 ===
     
@@ -134,11 +176,16 @@ class MusicQueue:
         return self._current_index
     
     @property
-    def all_songs(self) -> List[Song]:
-        """取得所有歌曲（只讀）"""
-        return self._queue.copy()
+    def all_songs(self) -> Tuple[Song, ...]:
+        """取得所有歌曲的快照（tuple，呼叫端無法修改佇列）"""
+        return tuple(self._queue)
+    
+    def iter_songs(self) -> Iterator[Song]:
+        """逐一走訪所有歌曲（只讀，不複製佇列；走訪期間不要修改佇列）"""
+        return iter(self._queue)
     
-    # === 新增/移除操作（全部異步，使用鎖保護）===
+    # === 新增/移除操作 ===
+    # 保留 async 介面；方法內沒有 await，在事件迴圈中本身就不會被打斷，不需要額外加鎖
     
     async def add(self, song: Song) -> Song:
         """
@@ -147,34 +194,32 @@ class MusicQueue:
         Returns:
             新增的歌曲
         """
-        async with self._lock:
-            self._queue.append(song)
-            
-            # 如果是第一首，自動設定為當前
-            if len(self._queue) == 1:
-                self._current_index = 0
-            
-            logger.debug(f"已新增歌曲: {song.title}，目前共 {len(self._queue)} 首")
-            return song
+        self._queue.append(song)
+        
+        # 如果是第一首，自動設定為當前
+        if len(self._queue) == 1:
+            self._current_index = 0
+        
+        logger.debug(f"已新增歌曲: {song.title}，目前共 {len(self._queue)} 首")
+        return song
     
-    async def add_many(self, songs: List[Song]) -> List[Song]:
+    async def add_many(self, songs: List[Song]) -> int:
         """
         批次新增歌曲
         
         Returns:
-            成功新增的歌曲列表
-        """
-        async with self._lock:
-            first_add = len(self._queue) == 0
-            
-            self._queue.extend(songs)
-            
-            # 如果之前是空的，設定第一首為當前
-            if first_add and len(self._queue) > 0:
-                self._current_index = 0
-            
-            logger.debug(f"批次新增 {len(songs)} 首歌曲，目前共 {len(self._queue)} 首")
-            return songs
+            第一首新歌的 0-based 位置（新增的範圍為 [start, start + len(songs))）
+        """
+        start = len(self._queue)
+        self._queue.extend(songs)
+        size = len(self._queue)
+        
+        # 如果之前是空的，設定第一首為當前
+        if start == 0 and size > 0:
+            self._current_index = 0
+        
+        logger.debug(f"批次新增 {size - start} 首歌曲，目前共 {size} 首")
+        return start
     
     async def remove(self, song_id: str) -> Optional[Song]:
         """
@@ -186,24 +231,16 @@ class MusicQueue:
         Returns:
             被移除的歌曲，若找不到則返回 None
         """
-        async with self._lock:
-            for i, song in enumerate(self._queue):
-                if song.id == song_id:
-                    removed = self._queue.pop(i)
-                    
-                    # 調整 current_index
-                    if len(self._queue) == 0:
-                        self._current_index = -1
-                    elif i < self._current_index:
-                        self._current_index -= 1
-                    elif i == self._current_index:
-                        if self._current_index >= len(self._queue):
-                            self._current_index = len(self._queue) - 1
-                    
-                    logger.debug(f"已移除歌曲: {removed.title}")
-                    return removed
-            
-            return None
+        # 快速路徑：被移除的通常是剛播放失敗的當前歌曲，不必掃描整個佇列
+        current = self.current_song
+        if current is not None and current.id == song_id:
+            return self._pop_at(self._current_index)
+        
+        for i, song in enumerate(self._queue):
+            if song.id == song_id:
+                return self._pop_at(i)
+        
+        return None
     
     async def remove_by_index(self, index: int) -> Optional[Song]:
         """
@@ -215,27 +252,11 @@ class MusicQueue:
         Returns:
             被移除的歌曲，若索引無效則返回 None
         """
-        async with self._lock:
-            pos = index - 1  # 轉換為 0-based
-            
-            if pos < 0 or pos >= len(self._queue):
-                return None
-            
-            removed = self._queue.pop(pos)
-            
-            # 調整 current_index
-            if len(self._queue) == 0:
-                self._current_index = -1
-            elif pos < self._current_index:
-                # 移除的在當前之前，索引減 1
-                self._current_index -= 1
-            elif pos == self._current_index:
-                # 移除的是當前歌曲
-                if self._current_index >= len(self._queue):
-                    self._current_index = len(self._queue) - 1
-            
-            logger.debug(f"已移除歌曲: {removed.title}")
-            return removed
+        pos = self._resolve(index, one_based=True)
+        if pos is None:
+            return None
+        
+        return self._pop_at(pos)
     
     async def clear(self) -> int:
         """
@@ -244,12 +265,11 @@ class MusicQueue:
         Returns:
             被清空的歌曲數量
         """
-        async with self._lock:
-            count = len(self._queue)
-            self._queue.clear()
-            self._current_index = -1
-            logger.debug(f"已清空播放佇列，共移除 {count} 首歌曲")
-            return count
+        count = len(self._queue)
+        self._queue.clear()
+        self._current_index = -1
+        logger.debug(f"已清空播放佇列，共移除 {count} 首歌曲")
+        return count
     
     # === 導航操作 ===
     
@@ -263,20 +283,22 @@ class MusicQueue:
         Returns:
             下一首歌曲，若無則返回 None
         """
-        if len(self._queue) == 0:
+        size = len(self._queue)
+        if size == 0:
             return None
         
+        index = self._current_index + 1
         if self._loop:
             # 循環模式：永遠有下一首
-            self._current_index = (self._current_index + 1) % len(self._queue)
-        else:
+            index %= size
+        elif index >= size:
             # 非循環模式：到底就停
-            if self._current_index + 1 >= len(self._queue):
-                return None
-            self._current_index += 1
+            return None
         
-        logger.debug(f"下一首: {self.current_song.title if self.current_song else 'None'}")
-        return self.current_song
+        self._current_index = index
+        song = self._queue[index]
+        logger.debug(f"下一首: {song.title}")
+        return song
     
     def previous(self) -> Optional[Song]:
         """
@@ -288,22 +310,24 @@ class MusicQueue:
         Returns:
             上一首歌曲，若無則返回 None
         """
-        if len(self._queue) == 0:
+        size = len(self._queue)
+        if size == 0:
             return None
         
+        index = self._current_index - 1
         if self._loop:
             # 循環模式：永遠有上一首
-            self._current_index = (self._current_index - 1) % len(self._queue)
-        else:
+            index %= size
+        elif index < 0:
             # 非循環模式：到頂就停
-            if self._current_index <= 0:
-                return None
-            self._current_index -= 1
+            return None
         
-        logger.debug(f"上一首: {self.current_song.title if self.current_song else 'None'}")
-        return self.current_song
+        self._current_index = index
+        song = self._queue[index]
+        logger.debug(f"上一首: {song.title}")
+        return song
     
-    def jump_to(self, index: int) -> Optional[Song]:
+    def jump_to(self, index: int) -> Song:
         """
         跳轉到指定索引
         
@@ -311,17 +335,24 @@ class MusicQueue:
             index: 0-based 索引
         
         Returns:
-            目標歌曲，若索引無效則返回 None
+            目標歌曲
+        
+        Raises:
+            QueueError: 索引超出範圍（user_message 附上可用的編號範圍）
         """
-        if index < 0 or index >= len(self._queue):
-            logger.warning(f"跳轉失敗：無效的索引 {index}（共 {len(self._queue)} 首）")
-            return None
+        if self._resolve(index) is None:
+            size = len(self._queue)
+            raise QueueError(
+                message=f"Invalid queue index {index} (size {size})",
+                user_message=f"找不到編號為 {index + 1} 的歌曲（範圍：1-{size}）",
+            )
         
         self._current_index = index
-        logger.debug(f"跳轉到第 {index + 1} 首: {self.current_song.title}")
-        return self.current_song
+        song = self._queue[index]
+        logger.debug(f"跳轉到第 {index + 1} 首: {song.title}")
+        return song
     
-    def jump_to_one_based(self, index: int) -> Optional[Song]:
+    def jump_to_one_based(self, index: int) -> Song:
         """
         跳轉到指定編號（1-based）
         
@@ -329,7 +360,10 @@ class MusicQueue:
             index: 1-based 索引
         
         Returns:
-            目標歌曲，若索引無效則返回 None
+            目標歌曲
+        
+        Raises:
+            QueueError: 編號超出範圍
         """
         return self.jump_to(index - 1)
     
@@ -337,20 +371,34 @@ class MusicQueue:
     
     def has_next(self) -> bool:
         """是否有下一首可播放"""
-        if len(self._queue) == 0:
-            return False
         if self._loop:
             return len(self._queue) > 1
         return self._current_index + 1 < len(self._queue)
     
     def has_previous(self) -> bool:
         """是否有上一首可播放"""
-        if len(self._queue) == 0:
-            return False
         if self._loop:
             return len(self._queue) > 1
+        # 佇列為空時 current_index 固定為 -1，不必再另外檢查長度
         return self._current_index > 0
     
+    def window(self, behind: int, ahead: int) -> tuple[List[Song], int]:
+        """
+        取得當前歌曲前後的歌曲片段（給 CacheManager 用，不複製整個佇列）
+        
+        Args:
+            behind: 當前歌曲之前取幾首
+            ahead: 當前歌曲之後取幾首
+        
+        Returns:
+            (歌曲片段, 當前歌曲在片段中的索引)；沒有當前歌曲時返回 ([], -1)
+        """
+        if self._current_index < 0:
+            return [], -1
+        
+        start = max(0, self._current_index - behind)
+        return self._queue[start:self._current_index + ahead + 1], self._current_index - start
+    
     def get_song(self, index: int) -> Optional[Song]:
         """
         取得指定編號的歌曲
@@ -361,8 +409,8 @@ class MusicQueue:
         Returns:
             歌曲，若索引無效則返回 None
         """
-        pos = index - 1
-        if pos < 0 or pos >= len(self._queue):
+        pos = self._resolve(index, one_based=True)
+        if pos is None:
             return None
         return self._queue[pos]
     
@@ -376,13 +424,35 @@ class MusicQueue:
         Returns:
             接下來的歌曲列表（不含當前歌曲）
         """
-        if len(self._queue) == 0 or self._current_index < 0:
+        # 佇列為空時 current_index 固定為 -1
+        if self._current_index < 0:
             return []
         
         start = self._current_index + 1
-        end = min(start + count, len(self._queue))
+        return self._queue[start:start + count]
+    
+    def get_upcoming_loop(self, count: int = 3) -> List[Song]:
+        """
+        取得接下來要播放的歌曲（循環模式：到尾端後接回開頭）
         
-        return self._queue[start:end]
+        Args:
+            count: 要取得的數量（最多到當前歌曲的前一首為止）
+        
+        Returns:
+            接下來的歌曲列表（不含當前歌曲）
+        """
+        if not self._loop:
+            return self.get_upcoming(count)
+        if self._current_index < 0:
+            return []
+        
+        count = min(count, len(self._queue) - 1)
+        start = self._current_index + 1
+        upcoming = self._queue[start:start + count]
+        wrap = count - len(upcoming)
+        if wrap > 0:
+            upcoming.extend(self._queue[:wrap])
+        return upcoming
     
     def get_previous_songs(self, count: int = 2) -> List[Song]:
         """
@@ -394,16 +464,23 @@ class MusicQueue:
         Returns:
             之前的歌曲列表（不含當前歌曲）
         """
-        if len(self._queue) == 0 or self._current_index <= 0:
+        if self._current_index <= 0:
             return []
         
-        start = max(0, self._current_index - count)
         end = self._current_index
-        
-        return self._queue[start:end]
+        return self._queue[max(0, end - count):end]
     
     # === 分頁顯示 ===
     
+    def page_count(self, per_page: int = 5) -> int:
+        """
+        取得總頁數（至少 1 頁）
+        
+        Args:
+            per_page: 每頁數量
+        """
+        return max(1, (len(self._queue) + per_page - 1) // per_page)
+    
     def get_page(self, page: int = 1, per_page: int = 5) -> dict:
         """
         取得分頁資料
@@ -421,12 +498,13 @@ class MusicQueue:
             - current_index: 當前播放的編號（1-based）
         """
         total = len(self._queue)
-        total_pages = max(1, (total + per_page - 1) // per_page)
+        total_pages = self.page_count(per_page)
         page = max(1, min(page, total_pages))
         
         start = (page - 1) * per_page
         end = start + per_page
         
+        # 切片最多只有 per_page 首，翻頁時不會複製整個佇列
         return {
             "songs": self._queue[start:end],
             "start_index": start + 1,  # 1-based
@@ -440,12 +518,49 @@ class MusicQueue:
         """返回佇列中的歌曲數量"""
         return len(self._queue)
     
-    def __iter__(self):
+    def __iter__(self) -> Iterator[Song]:
         """支援迭代"""
-        return iter(self._queue)
+        return self.iter_songs()
     
     # === 內部方法 ===
     
+    def _resolve(self, index: int, one_based: bool = False) -> Optional[int]:
+        """
+        將索引轉換為 0-based 位置並檢查範圍
+        
+        Args:
+            index: 索引
+            one_based: index 是否為使用者看到的 1-based 編號
+        
+        Returns:
+            有效的 0-based 位置，超出範圍則返回 None
+        """
+        pos = index - 1 if one_based else index
+        return pos if 0 <= pos < len(self._queue) else None
+    
+    def _pop_at(self, pos: int) -> Song:
+        """
+        移除指定位置的歌曲並調整 current_index
+        
+        Args:
+            pos: 0-based 索引（必須有效）
+        """
+        removed = self._queue.pop(pos)
+        
+        # 調整 current_index
+        if len(self._queue) == 0:
+            self._current_index = -1
+        elif pos < self._current_index:
+            # 移除的在當前之前，索引減 1
+            self._current_index -= 1
+        elif pos == self._current_index:
+            # 移除的是當前歌曲
+            if self._current_index >= len(self._queue):
+                self._current_index = len(self._queue) - 1
+        
+        logger.debug(f"已移除歌曲: {removed.title}")
+        return removed
+    
     def _get_window_indices(self, behind: int = 2, ahead: int = 3) -> List[int]:
         """
         取得滑動窗口內的索引（給 CacheManager 用）
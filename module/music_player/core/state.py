@@ -2,15 +2,17 @@
 播放狀態追蹤
 
 精確追蹤播放時間，解決「播放秒數與實際脫鉤」的問題。
-使用時間戳計算而非累加，確保暫停/恢復後時間正確。
+使用單調時鐘時間戳計算而非累加，確保暫停/恢復後時間正確，也不受系統校時影響。
 """
 
 import time
 from dataclasses import dataclass, field
 from typing import Optional
 
+from ..constants import PROGRESS_BAR_LENGTH, PROGRESS_BARS
 
-@dataclass
+
+@dataclass(slots=True)
 class PlaybackState:
     """
     精確追蹤播放狀態
@@ -36,6 +38,7 @@ class PlaybackState:
     _pause_start: float = field(default=0, repr=False)
     _total_paused: float = field(default=0, repr=False)
     _duration: int = field(default=0, repr=False)
+    _duration_str: str = field(default="0:00", repr=False)  # 總長字串，start() 時算一次
     
     # 當前歌曲資訊（可選）
     _current_song_id: Optional[str] = field(default=None, repr=False)
@@ -59,9 +62,10 @@ class PlaybackState:
         """
         self.is_playing = True
         self.is_paused = False
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         self._total_paused = 0
         self._duration = duration
+        self._duration_str = self.format_time(duration)
         self._current_song_id = song_id
         self._playback_session_id = playback_session_id
     
@@ -74,7 +78,7 @@ class PlaybackState:
         """
         if self.is_playing and not self.is_paused:
             self.is_paused = True
-            self._pause_start = time.time()
+            self._pause_start = time.monotonic()
             return True
         return False
     
@@ -87,7 +91,7 @@ class PlaybackState:
         """
         if self.is_paused:
             self.is_paused = False
-            self._total_paused += time.time() - self._pause_start
+            self._total_paused += time.monotonic() - self._pause_start
             return True
         return False
     
@@ -105,6 +109,7 @@ class PlaybackState:
         """完全重置（包括 duration）"""
         self.stop()
         self._duration = 0
+        self._duration_str = "0:00"
     
     @property
     def current_position(self) -> int:
@@ -117,15 +122,16 @@ class PlaybackState:
         if not self.is_playing:
             return 0
         
-        if self.is_paused:
-            # 暫停時：計算到暫停那一刻的時間
-            elapsed = self._pause_start - self._start_time - self._total_paused
-        else:
-            # 播放中：計算到現在的時間
-            elapsed = time.time() - self._start_time - self._total_paused
+        # 暫停時計算到暫停那一刻，播放中計算到現在
+        end = self._pause_start if self.is_paused else time.monotonic()
+        elapsed = end - self._start_time - self._total_paused
         
         # 確保在有效範圍內
-        return max(0, min(int(elapsed), self._duration))
+        if elapsed <= 0:
+            return 0
+        if elapsed >= self._duration:
+            return self._duration
+        return int(elapsed)
     
     @property
     def remaining(self) -> int:
@@ -178,15 +184,11 @@ class PlaybackState:
         if seconds is None:
             seconds = self.current_position
         
-        if seconds >= 3600:
-            hours = seconds // 3600
-            minutes = (seconds % 3600) // 60
-            secs = seconds % 60
+        minutes, secs = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        if hours:
             return f"{hours}:{minutes:02d}:{secs:02d}"
-        else:
-            minutes = seconds // 60
-            secs = seconds % 60
-            return f"{minutes}:{secs:02d}"
+        return f"{minutes}:{secs:02d}"
     
     @property
     def progress_bar(self) -> str:
@@ -194,12 +196,15 @@ class PlaybackState:
         生成進度條字串
         
         Returns:
-            例如：「▓▓▓▓▓▓░░░░░░░░░」
+            例如：「▰▰▰▰▰▰▱▱▱▱▱▱▱▱▱」
         """
-        total_blocks = 15
-        filled = int((self.progress_percentage / 100) * total_blocks)
-        empty = total_blocks - filled
-        return "▓" * filled + "░" * empty
+        return self._progress_bar_at(self.current_position)
+    
+    def _progress_bar_at(self, position: int) -> str:
+        """依指定播放位置查表取得進度條"""
+        if self._duration <= 0:
+            return PROGRESS_BARS[0]
+        return PROGRESS_BARS[position * PROGRESS_BAR_LENGTH // self._duration]
     
     @property
     def progress_display(self) -> str:
@@ -207,11 +212,11 @@ class PlaybackState:
         生成完整的進度顯示
         
         Returns:
-            例如：「1:23 ▓▓▓▓▓░░░░░░░░░░ 3:45」
+            例如：「1:23 ▰▰▰▰▰▱▱▱▱▱▱▱▱▱▱ 3:45」
         """
-        current = self.format_time(self.current_position)
-        total = self.format_time(self._duration)
-        return f"{current} {self.progress_bar} {total}"
+        # 只讀一次播放位置，時間與進度條保證一致
+        position = self.current_position
+        return f"{self.format_time(position)} {self._progress_bar_at(position)} {self._duration_str}"
     
     # === 手動操作追蹤 ===
     
@@ -221,9 +226,9 @@ class PlaybackState:
         
         用於防止手動操作後觸發的 on_song_end 回調造成重複切歌
         """
-        self._last_manual_operation_time = time.time()
+        self._last_manual_operation_time = time.monotonic()
     
     @property
     def last_manual_operation_time(self) -> float:
-        """上次手動操作的時間戳"""
+        """上次手動操作的時間戳（time.monotonic()，不受系統校時影響）"""
         return self._last_manual_operation_time
@@ -245,13 +245,15 @@ class YTDLPDownloader:
         
         Args:
             url: 影片 URL
-            song_id: 可選的歌曲 ID（用於快取檢查，若不提供會先提取資訊）
+            song_id: 可選的歌曲 ID（用於快取檢查，若不提供會先提取資訊）。
+                提供時表示呼叫者已持有歌曲資訊，不會再重複提取，回傳的資訊為 None
             timeout: 下載超時時間（秒）
         
         Returns:
             (歌曲資訊, 檔案路徑) 或 (錯誤資訊, None)
         """
         # 如果沒有提供 song_id，先提取資訊
+        info: Optional[dict] = None
         if song_id is None:
             info = await self.extract_info(url)
             if not info:
@@ -259,25 +261,14 @@ class YTDLPDownloader:
             if info.get("success") is False:
                 return info, None
             song_id = info["id"]
-        else:
-            info = None
         
         opus_path = self.cache_dir / f"{song_id}.opus"
         
         # 已有快取，直接回傳
         if opus_path.exists():
             logger.debug(f"快取已存在: {song_id}")
-            # 如果還沒有 info，需要提取
-            if info is None:
-                info = await self.extract_info(url)
             return info, opus_path
         
-        # 如果還沒有 info，提取它
-        if info is None:
-            info = await self.extract_info(url)
-            if not info or info.get("success") is False:
-                return info, None
-        
         # 下載
         output_template = str(self.cache_dir / f"{song_id}.%(ext)s")
         args = [
@@ -311,22 +302,22 @@ class YTDLPDownloader:
             downloaded = self._find_downloaded_file(song_id)
             if not downloaded:
                 logger.error("找不到下載的檔案")
-                return None, None
+                return info, None
             
             # 轉換為 opus
             opus_path = await self._convert_to_opus(downloaded, song_id)
             if not opus_path:
-                return None, None
+                return info, None
             
-            logger.debug(f"下載完成: {info.get('title', song_id)}")
+            logger.debug(f"下載完成: {info.get('title', song_id) if info else song_id}")
             return info, opus_path
             
         except asyncio.TimeoutError:
             logger.error(f"下載超時: {url}")
-            return None, None
+            return info, None
         except Exception as e:
             logger.error(f"下載錯誤: {e}")
-            return None, None
+            return info, None
     
     def get_cached_path(self, song_id: str) -> Optional[Path]:
         """
@@ -70,15 +70,15 @@ class FFmpegManager:
         Returns:
             FFmpeg 執行路徑，失敗返回 None
         """
-        # 1. 檢查系統 PATH
-        system_ffmpeg = self._find_in_path()
+        # 1. 檢查系統 PATH（驗證時會執行 ffmpeg -version，移到執行緒避免阻塞事件迴圈）
+        system_ffmpeg = await asyncio.to_thread(self._find_in_path)
         if system_ffmpeg:
             logger.info(f"使用系統 FFmpeg: {system_ffmpeg}")
             self._ffmpeg_path = system_ffmpeg
             return system_ffmpeg
         
         # 2. 檢查本地快取
-        cached = self._find_cached()
+        cached = await asyncio.to_thread(self._find_cached)
         if cached:
             logger.info(f"使用快取 FFmpeg: {cached}")
             self._ffmpeg_path = str(cached)
@@ -329,8 +329,8 @@ def create_player_view(
     
     # 更新導航按鈕狀態
     view.update_navigation(
-        has_previous=player.queue.current_index > 0,
-        has_next=player.queue.current_index < len(player.queue) - 1,
+        has_previous=player.queue.has_previous(),
+        has_next=player.queue.has_next(),
     )
     
     return view
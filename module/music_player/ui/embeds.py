@@ -16,6 +16,7 @@ from ..constants import (
     PROGRESS_BAR_LENGTH,
     PROGRESS_BAR_FILLED,
     PROGRESS_BAR_EMPTY,
+    PROGRESS_BARS,
 )
 
 if TYPE_CHECKING:
@@ -39,6 +40,19 @@ class EmbedBuilder:
     COLOR_ERROR = discord.Color.red()
     COLOR_INFO = discord.Color.blue()
     
+    # 固定外觀的 Embed 範本，每次呼叫只需合併變動的欄位再交給 Embed.from_dict
+    _INFO_TEMPLATE = {"type": "rich", "color": COLOR_INFO.value}
+    _REMOVED_SONG_TEMPLATE = {
+        "type": "rich",
+        "title": "🗑️ 已移除歌曲",
+        "color": discord.Color.orange().value,
+    }
+    
+    def __init__(self):
+        # 播放中 Embed 的靜態部分（作者、標題、縮圖）快取：((song_id, index), embed dict)
+        # 定期更新同一首歌時只需重建狀態欄位與 footer
+        self._playing_base: Optional[tuple] = None
+    
     # === 播放相關 ===
     
     def playing(
@@ -70,15 +84,8 @@ class EmbedBuilder:
             current_str = self._format_time(current_time)
             duration_str = self._format_time(duration)
             
-            embed = discord.Embed(color=color)
-            
-            # 作者
-            embed.set_author(name=song.uploader, url=song.uploader_url or None)
-            
-            # 標題（含編號）
-            title_text = f"{index}. " if index else ""
-            title_text += song.title
-            embed.description = f"[{title_text}]({song.url})"
+            embed = discord.Embed.from_dict(self._playing_base_dict(song, index))
+            embed.color = color
             
             # 狀態欄位
             embed.add_field(
@@ -87,10 +94,6 @@ class EmbedBuilder:
                 inline=False
             )
             
-            # 縮圖
-            if song.thumbnail:
-                embed.set_thumbnail(url=song.thumbnail)
-            
             # Footer
             footer_text = f"循環播放: {'開啟 🔁' if is_looping else '關閉'}"
             embed.set_footer(text=footer_text)
@@ -101,6 +104,36 @@ class EmbedBuilder:
             logger.error(f"生成播放 Embed 失敗: {e}")
             return self.error("無法顯示播放資訊")
     
+    def _playing_base_dict(self, song: "Song", index: Optional[int]) -> dict:
+        """
+        取得播放中 Embed 的靜態部分（同一首歌重複使用快取）
+        
+        回傳的 dict 只會被 Embed.from_dict 讀取，不含欄位與 footer，
+        因此後續 add_field / set_footer 不會改動快取內容
+        """
+        key = (song.id, index)
+        cached = self._playing_base
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        embed = discord.Embed()
+        
+        # 作者
+        embed.set_author(name=song.uploader, url=song.uploader_url or None)
+        
+        # 標題（含編號）
+        title_text = f"{index}. " if index else ""
+        title_text += song.title
+        embed.description = f"[{title_text}]({song.url})"
+        
+        # 縮圖
+        if song.thumbnail:
+            embed.set_thumbnail(url=song.thumbnail)
+        
+        base = embed.to_dict()
+        self._playing_base = (key, base)
+        return base
+    
     def player_embed(self, player: "MusicPlayer") -> discord.Embed:
         """
         根據 MusicPlayer 狀態生成 Embed
@@ -155,8 +188,8 @@ class EmbedBuilder:
                     song_index = start_index + i
                     # 標記當前播放的歌曲
                     prefix = "▶️ " if song_index == current_index else ""
-                    duration_str = self._format_time(song.duration)
-                    lines.append(f"{prefix}{song_index}. [{song.title}]({song.url}) `{duration_str}`")
+                    # Song 會記住格式化後的時長，來回翻頁不必重算
+                    lines.append(f"{prefix}{song_index}. [{song.title}]({song.url}) `{song.format_duration()}`")
                 
                 embed.description = "\n".join(lines)
             
@@ -228,14 +261,10 @@ class EmbedBuilder:
         """
         生成移除歌曲成功的 Embed
         """
-        embed = discord.Embed(
-            title="🗑️ 已移除歌曲",
-            description=f"[{song.title}]({song.url})",
-            color=discord.Color.orange()
-        )
+        data = {**self._REMOVED_SONG_TEMPLATE, "description": f"[{song.title}]({song.url})"}
         if song.thumbnail:
-            embed.set_thumbnail(url=song.thumbnail)
-        return embed
+            data["thumbnail"] = {"url": song.thumbnail}
+        return discord.Embed.from_dict(data)
     
     def cleared_playlist(self, count: int) -> discord.Embed:
         """
@@ -279,12 +308,10 @@ class EmbedBuilder:
     
     def info(self, message: str, description: str = None) -> discord.Embed:
         """資訊訊息"""
-        embed = discord.Embed(
-            title=f"ℹ️ {message}",
-            description=description,
-            color=self.COLOR_INFO
-        )
-        return embed
+        data = {**self._INFO_TEMPLATE, "title": f"ℹ️ {message}"}
+        if description is not None:
+            data["description"] = description
+        return discord.Embed.from_dict(data)
     
     def warning(self, message: str, description: str = None) -> discord.Embed:
         """警告訊息"""
@@ -305,7 +332,19 @@ class EmbedBuilder:
     # === 內部方法 ===
     
     @staticmethod
-    def _create_progress_bar(current: int | float, total: int | float, length: int = PROGRESS_BAR_LENGTH) -> str:
+    def progress_cells(current: int | float, total: int | float, length: int = PROGRESS_BAR_LENGTH) -> int:
+        """
+        計算進度條的填滿格數（播放器定期更新也用它判斷進度條是否有變化）
+        
+        Args:
+            current: 當前位置（秒）
+            total: 總長度（秒），必須大於 0
+            length: 進度條長度
+        """
+        return min(int(current * length // total), length)
+    
+    @classmethod
+    def _create_progress_bar(cls, current: int | float, total: int | float, length: int = PROGRESS_BAR_LENGTH) -> str:
         """
         建立進度條（使用方塊風格，支援 int 和 float）
         
@@ -321,9 +360,11 @@ class EmbedBuilder:
         if total <= 0:
             return PROGRESS_BAR_EMPTY * length
         
-        progress = min(int((current / total) * length), length)
-        bar = PROGRESS_BAR_FILLED * progress + PROGRESS_BAR_EMPTY * (length - progress)
-        return bar
+        progress = cls.progress_cells(current, total, length)
+        if length == PROGRESS_BAR_LENGTH:
+            # 預設長度直接查表，每次更新播放器不必重新組字串
+            return PROGRESS_BARS[progress]
+        return PROGRESS_BAR_FILLED * progress + PROGRESS_BAR_EMPTY * (length - progress)
     
     @staticmethod
     def _format_time(seconds: int | float) -> str:
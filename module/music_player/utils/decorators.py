@@ -144,7 +144,7 @@ def cooldown(seconds: float = 1.0):
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
         @wraps(func)
         async def wrapper(self, *args, **kwargs):
-            now = time.time()
+            now = time.monotonic()
             key = id(self)
             
             if key in last_call and now - last_call[key] < seconds:
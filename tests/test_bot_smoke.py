@@ -22,6 +22,12 @@ class MeowBotConfigurationTests(unittest.TestCase):
     def test_required_intents_are_enabled(self) -> None:
         self.assertTrue(bot.intents.members)
         self.assertTrue(bot.intents.message_content)
+        self.assertTrue(bot.intents.voice_states)
+        self.assertTrue(bot.intents.guild_reactions)
+
+    def test_unused_intents_are_disabled(self) -> None:
+        self.assertFalse(bot.intents.typing)
+        self.assertFalse(bot.intents.presences)
 
     def test_direct_messages_do_not_receive_admin_access(self) -> None:
         interaction = SimpleNamespace(guild=None, user=object())
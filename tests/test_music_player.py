@@ -0,0 +1,180 @@
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+
+from module.music_player.core.cache import CacheManager
+from module.music_player.core.queue import MusicQueue, Song
+from module.music_player.utils.errors import QueueError
+
+
+def make_song(song_id: str) -> Song:
+    return Song(id=song_id, title=song_id, url=f"https://example.com/{song_id}", duration=60, uploader="")
+
+
+class CacheEvictionTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self._tmp = TemporaryDirectory()
+        self.cache_dir = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _make_cache(self, files: dict[str, int], max_bytes: int) -> CacheManager:
+        for song_id, size in files.items():
+            (self.cache_dir / f"{song_id}.opus").write_bytes(b"\0" * size)
+        return CacheManager(
+            cache_dir=str(self.cache_dir),
+            window_behind=1,
+            window_ahead=1,
+            max_bytes=max_bytes,
+        )
+
+    def _set_usage(self, cache: CacheManager, song_id: str, freq: int, last_access: float) -> None:
+        entry = cache._index[song_id]
+        entry.freq = freq
+        entry.last_access = last_access
+
+    def _remaining(self) -> set[str]:
+        return {path.stem for path in self.cache_dir.glob("*.opus")}
+
+    async def test_keeps_everything_under_budget(self) -> None:
+        cache = self._make_cache({"a": 10, "b": 10, "c": 10}, max_bytes=30)
+        cache._keep_ids = {"c"}
+
+        await cache._cleanup_old()
+
+        self.assertEqual(self._remaining(), {"a", "b", "c"})
+        self.assertEqual(cache.get_cache_size(), 30)
+
+    async def test_evicts_by_freq_then_last_access_until_within_budget(self) -> None:
+        cache = self._make_cache(
+            {"hot": 10, "old": 10, "recent": 10, "rare": 10, "current": 10},
+            max_bytes=25,
+        )
+        cache._keep_ids = {"current"}
+        self._set_usage(cache, "hot", freq=5, last_access=1.0)
+        self._set_usage(cache, "old", freq=1, last_access=1.0)
+        self._set_usage(cache, "recent", freq=1, last_access=2.0)
+        self._set_usage(cache, "rare", freq=0, last_access=3.0)
+
+        self.assertEqual(
+            cache._select_victims(cache._index.keys() - cache._keep_ids),
+            ["rare", "old", "recent"],
+        )
+
+        await cache._cleanup_old()
+
+        self.assertEqual(self._remaining(), {"hot", "current"})
+        self.assertLessEqual(cache.get_cache_size(), cache.max_bytes)
+
+    async def test_never_evicts_kept_ids(self) -> None:
+        cache = self._make_cache({"a": 10, "b": 10, "c": 10}, max_bytes=1)
+        cache._keep_ids = {"a", "b"}
+
+        await cache._cleanup_old()
+
+        # 保留集合本身超過上限也不會被刪除
+        self.assertEqual(self._remaining(), {"a", "b"})
+        self.assertEqual(set(cache._index), {"a", "b"})
+
+    async def test_zero_budget_evicts_every_candidate(self) -> None:
+        cache = self._make_cache({"a": 1, "b": 1, "c": 1}, max_bytes=0)
+        cache._keep_ids = {"b"}
+
+        await cache._cleanup_old()
+
+        self.assertEqual(self._remaining(), {"b"})
+
+
+class BlockingDownloader:
+    """下載會一直等待到被取消，用來觀察進行中的預載"""
+
+    def __init__(self) -> None:
+        self.requested: list[str] = []
+
+    async def download(self, url: str, song_id: str) -> tuple[None, None]:
+        self.requested.append(song_id)
+        await asyncio.Event().wait()
+        return None, None
+
+
+class CacheWindowTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._tmp = TemporaryDirectory()
+        self.cache = CacheManager(
+            cache_dir=self._tmp.name,
+            window_behind=1,
+            window_ahead=2,
+            max_concurrent_preloads=5,
+        )
+        self.queue = MusicQueue()
+        await self.queue.add_many([make_song(f"s{i}") for i in range(8)])
+        self.downloader = BlockingDownloader()
+        patcher = mock.patch("module.music_player.core.cache.CACHE_CHANGE_DEBOUNCE", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self) -> None:
+        await self.cache.cancel_all_preloads_and_wait()
+        self._tmp.cleanup()
+
+    async def _song_change(self) -> None:
+        songs, index = self.queue.window(self.cache.window_behind, self.cache.window_ahead)
+        await self.cache.on_song_change(songs, index, self.downloader)
+        await self.cache._change_task
+        # 讓新建立的預載任務開始執行
+        await asyncio.sleep(0)
+
+    async def test_unchanged_window_skips_cleanup_and_preload(self) -> None:
+        with (
+            mock.patch.object(self.cache, "_cleanup_old", wraps=self.cache._cleanup_old) as cleanup,
+            mock.patch.object(self.cache, "_preload_ahead", wraps=self.cache._preload_ahead) as preload,
+        ):
+            await self._song_change()
+            self.assertEqual((cleanup.await_count, preload.await_count), (1, 1))
+            self.assertEqual(set(self.cache._preload_tasks), {"s1", "s2"})
+
+            await self._song_change()
+            self.assertEqual((cleanup.await_count, preload.await_count), (1, 1))
+            self.assertEqual(self.downloader.requested, ["s1", "s2"])
+
+    async def test_changed_window_cancels_stale_preloads(self) -> None:
+        await self._song_change()
+        stale = dict(self.cache._preload_tasks)
+        self.assertEqual(set(stale), {"s1", "s2"})
+
+        self.queue.jump_to(5)
+        await self._song_change()
+        await asyncio.gather(*stale.values(), return_exceptions=True)
+
+        self.assertTrue(all(task.cancelled() for task in stale.values()))
+        self.assertEqual(set(self.cache._preload_tasks), {"s6", "s7"})
+
+
+class MusicQueueJumpTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.queue = MusicQueue()
+        await self.queue.add_many([make_song(f"s{i}") for i in range(3)])
+
+    def test_invalid_index_raises_queue_error_with_range(self) -> None:
+        for index in (3, -1):
+            with self.subTest(index=index):
+                with self.assertRaises(QueueError) as caught:
+                    self.queue.jump_to(index)
+
+                self.assertIn("1-3", caught.exception.user_message)
+                self.assertEqual(self.queue.current_index, 0)
+
+    def test_jump_to_one_based_maps_to_zero_based_index(self) -> None:
+        self.queue.jump_to(2)
+
+        song = self.queue.jump_to_one_based(1)
+
+        self.assertEqual(song.id, "s0")
+        self.assertEqual(self.queue.current_index, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()